@@ -0,0 +1,209 @@
+from conflicts import AssignmentIndex
+from standings import render_standings
+
+DIVIDER = "**────────────**\n"
+
+# discord rejects longer messages
+MESSAGE_LIMIT = 2000
+
+
+class AnnouncementError(Exception):
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+
+
+def validate_teams(label, team1, team2):
+
+    # ensure teams are different and not blank
+    if not team1 or not team2:
+        raise AnnouncementError("Incomplete Selection", f"In {label}, both teams must be selected.")
+
+    if team1 == team2:
+        raise AnnouncementError("Invalid Teams", f"In {label}, both teams are the same.")
+
+
+def tally_match(label, team1, team2, games):
+    validate_teams(label, team1, team2)
+
+    match_entry = {
+        "team1": team1,
+        "team2": team2,
+        "games": [],
+        "overall_winner": ""
+    }
+
+    team1_wins = 0
+    team2_wins = 0
+
+    for map_name, winner in games:
+
+        # ensure map/winner selected
+        if not map_name or not winner:
+            raise AnnouncementError(
+                "Incomplete Selection",
+                f"In {label}, all games must have a map and a winner selected."
+            )
+
+        match_entry["games"].append({"map": map_name, "winner": winner})
+
+        if winner == team1:
+            team1_wins += 1
+
+        elif winner == team2:
+            team2_wins += 1
+
+    if team1_wins > team2_wins:
+        match_entry["overall_winner"] = team1
+
+    elif team2_wins > team1_wins:
+        match_entry["overall_winner"] = team2
+
+    else:
+        match_entry["overall_winner"] = "Draw"
+
+    return match_entry
+
+
+def collect_results(matches):
+    return [
+        tally_match(match.label, match.team1, match.team2, [(game.map, game.winner) for game in match.games])
+        for match in matches
+    ]
+
+
+def check_schedule(schedule):
+    for match in schedule:
+        validate_teams(f"Next Week {match.label}", match.team1, match.team2)
+
+
+def check_conflicts(week):
+
+    # one team in two matches, or scheduled while on bye
+    index = AssignmentIndex.from_week(week)
+    conflict = index.first_conflict()
+    if conflict:
+        raise AnnouncementError("Double-Booked Team", f"{index.describe(*conflict)}.")
+
+
+def iter_sections(results, schedule, bye_team=None, standings_text=None):
+
+    # each section is a list of blocks: a heading followed by blocks that are never split
+    yield [
+        "@Intramurals\n\n"
+        "once again, we're looking to **stream** some games this week.\n"
+        "please schedule your games asap in #match-chats so we can plan to stream them <3\n\n"
+        + DIVIDER + "\n"
+    ]
+
+    # MATCHES LAST WEEK
+    section = [":hibiscus: **MATCHES LAST WEEK**\n\n"]
+    for match in results:
+        winner = match["overall_winner"]
+        if winner != "Draw":
+            winner_text = f"{winner} WIN"
+        else:
+            winner_text = "DRAW"
+
+        lines = [f":coconut:{match['team1']} vs. :coconut:{match['team2']}: {winner_text}\n"]
+        lines.extend(f"{game['map']}: {game['winner']}\n" for game in match["games"])
+        lines.append("\n")
+        section.append("".join(lines))
+    yield section
+
+    if bye_team:
+        yield [DIVIDER + "\n" + f"**Bye:** {bye_team} has a bye this week.\n\n"]
+
+    # MATCHES THIS WEEK
+    section = [DIVIDER + "\n" + ":palm_tree: **MATCHES __THIS__ WEEK**\n\n"]
+    for match in schedule:
+        check = " ✅️" if match.scheduled else ""
+        section.append(f"@{match.team1} vs. @{match.team2}{check}\n[{match.display_time}]\n\n")
+    yield section
+
+    if standings_text:
+        section = [DIVIDER + "\n" + ":trophy: **STANDINGS**\n\n"]
+        section.extend(f"{line}\n" for line in standings_text.split("\n"))
+        section.append("\n")
+        yield section
+
+    yield [DIVIDER]
+
+
+def render_announcement(results, schedule, bye_team=None, standings_text=None):
+    return "".join(block for section in iter_sections(results, schedule, bye_team, standings_text) for block in section)
+
+
+def split_sections(text):
+
+    # edited text has no section markers, every paragraph becomes its own block
+    blocks = [paragraph + "\n\n" for paragraph in text.strip("\n").split("\n\n")]
+    blocks[-1] = blocks[-1][:-2]
+    return [blocks]
+
+
+def pack_messages(sections, limit=MESSAGE_LIMIT):
+    messages = []
+    parts = []
+    size = 0
+
+    def flush():
+        nonlocal parts, size
+
+        # discord rejects empty content, blank chunks are never a message of their own
+        message = "".join(parts).rstrip("\n")
+        if message.strip():
+            messages.append(message)
+        parts = []
+        size = 0
+
+    for section in sections:
+        blocks = list(section)
+
+        # a heading never ends a message on its own
+        if len(blocks) > 1:
+            blocks[0:2] = [blocks[0] + blocks[1]]
+
+        # a section that fits one message starts a new one rather than being split,
+        # a longer section is split anyway so it just keeps filling this one
+        section_size = sum(map(len, blocks))
+        if size and size + section_size > limit and section_size <= limit:
+            flush()
+
+        for block in blocks:
+            if size and size + len(block) > limit:
+                flush()
+
+            # only a block longer than a whole message is cut, at line breaks if possible
+            while len(block) > limit:
+                cut = block.rfind("\n", 0, limit) + 1 or limit
+                parts.append(block[:cut])
+                size += cut
+                flush()
+                block = block[cut:].lstrip("\n")
+
+            parts.append(block)
+            size += len(block)
+
+    flush()
+    return messages
+
+
+def announcement_sections(week, standings=None, week_number=None):
+    results = collect_results(week.matches)
+    check_schedule(week.next_week)
+    check_conflicts(week)
+
+    # standings are updated with this week's results before rendering
+    standings_text = None
+    if standings is not None:
+        standings.apply_week(week_number, results)
+        standings_text = render_standings(standings)
+
+    return list(iter_sections(results, week.next_week, week.bye_team, standings_text)), results
+
+
+def generate_announcement(week, standings=None, week_number=None):
+    sections, results = announcement_sections(week, standings, week_number)
+    return "".join(block for section in sections for block in section), results
@@ -0,0 +1,108 @@
+import json
+import threading
+from match_times import dump_time, parse_time
+from models import Game, Match, ScheduledMatch
+from utils import write_atomic
+
+AUTOSAVE_FILE = 'autosave.json'
+SESSION_VERSION = 1
+
+# the writer waits this long after a change so bursts of edits become one write
+WRITE_DELAY = 0.5
+
+
+def snapshot_session(matches, next_week_matches, bye_team, week_number):
+
+    # lists instead of dicts keep the file small and quick to parse
+    return {
+        "version": SESSION_VERSION,
+        "week_number": week_number,
+        "bye_team": bye_team,
+        "matches": [
+            [match.team1, match.team2, [[game.map, game.winner] for game in match.games]]
+            for match in matches
+        ],
+        "next_week": [
+            [match.team1, match.team2, match.datetime, match.scheduled, match.start and dump_time(match.start)]
+            for match in next_week_matches
+        ]
+    }
+
+
+def restore_session(state):
+    matches = []
+    for match_num, (team1, team2, games) in enumerate(state["matches"], start=1):
+        match = Match(match_num, team1, team2, num_games=0)
+        match.games = [Game(map_name, winner) for map_name, winner in games]
+        matches.append(match)
+
+    # sessions saved before times were parsed have no start
+    next_week_matches = [
+        ScheduledMatch(match_num, team1, team2, datetime, scheduled, parse_time(start[0]) if start and start[0] else None)
+        for match_num, (team1, team2, datetime, scheduled, *start) in enumerate(state["next_week"], start=1)
+    ]
+    return matches, next_week_matches, state["bye_team"], state["week_number"]
+
+
+def load_session(path=AUTOSAVE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != SESSION_VERSION:
+        return None
+    return state
+
+
+class AutosaveWriter:
+    def __init__(self, path=AUTOSAVE_FILE, delay=WRITE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.pending = None
+        self.closed = False
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="autosave", daemon=True)
+        self.thread.start()
+
+    def submit(self, state):
+
+        # only the latest snapshot matters, older ones are dropped
+        with self.lock:
+            self.pending = state
+        self.wake.set()
+
+    def run(self):
+        while True:
+            self.wake.wait()
+
+            # debounce, then take whatever is newest
+            if not self.closed:
+                self.wake.clear()
+                if self.wake.wait(self.delay):
+                    continue
+
+            # clear before taking, so a submit racing with us wakes the next loop
+            self.wake.clear()
+            with self.lock:
+                state, self.pending = self.pending, None
+                closed = self.closed
+
+            if state is not None:
+                try:
+                    write_atomic(self.path, json.dumps(state, separators=(",", ":")).encode('utf-8'))
+                except OSError:
+
+                    # a failed autosave must never take the app down, the next change retries
+                    pass
+            if closed:
+                return
+
+    def close(self, timeout=5):
+
+        # flush the last snapshot before the app exits
+        with self.lock:
+            self.closed = True
+        self.wake.set()
+        self.thread.join(timeout)
@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from divisions import load_manifest, run_division, run_divisions  # noqa: E402
+from league import MODES, write_league  # noqa: E402
+
+NUM_DIVISIONS = 50
+NUM_TEAMS = 400
+
+
+def write_division(directory, num_teams):
+    os.makedirs(directory)
+    teams, maps = write_league(directory, num_teams, 8)
+
+    matches = []
+    next_week = []
+    for i in range(0, num_teams - 1, 2):
+        team1, team2 = teams[i], teams[i + 1]
+        games = [{"map": maps[mode][i % 8], "winner": (team1, team2)[j % 2]} for j, mode in enumerate(MODES[:3 + i % 4])]
+        matches.append({"team1": team1, "team2": team2, "games": games})
+        next_week.append({"team1": team2, "team2": teams[(i + 2) % num_teams], "datetime": "Friday 8PM", "scheduled": True})
+    with open(os.path.join(directory, 'week.json'), 'w', encoding='utf-8') as file:
+        json.dump({"week": 1, "matches": matches, "next_week": next_week}, file)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = {"standings": True, "divisions": []}
+        for num in range(NUM_DIVISIONS):
+            name = f"Division {num}"
+            write_division(os.path.join(directory, name), NUM_TEAMS)
+            manifest["divisions"].append({"name": name, "week": 'week.json'})
+        manifest_path = os.path.join(directory, 'divisions.json')
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+        divisions = load_manifest(manifest_path)
+
+        cores = os.cpu_count() or 1
+        print(f"{NUM_DIVISIONS} divisions x {NUM_TEAMS} teams, {cores} core(s)")
+
+        # serial baseline in this process, then the pool at increasing sizes
+        start = time.perf_counter()
+        for division in divisions:
+            result = run_division(division.to_dict(), save=False)
+            assert result["ok"], result
+        serial = time.perf_counter() - start
+        print(f"  serial:     {serial:6.2f}s")
+
+        workers = 1
+        while True:
+            start = time.perf_counter()
+            results = run_divisions(divisions, workers=workers, save=False)
+            elapsed = time.perf_counter() - start
+            assert all(result["ok"] for result in results)
+            print(f"  {workers:2d} worker(s): {elapsed:6.2f}s ({serial / elapsed:.1f}x)")
+            if workers >= cores:
+                break
+            workers = min(workers * 2, cores)
+
+
+if __name__ == "__main__":
+    main()
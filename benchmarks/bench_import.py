@@ -0,0 +1,98 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from catalog import Catalog  # noqa: E402
+from importer import Importer  # noqa: E402
+from league import write_league  # noqa: E402
+from season_store import SeasonStore  # noqa: E402
+
+ROWS = [10000, 100000, 1000000]
+TEAMS = 400
+
+# share of rows with a misspelled team, so the reject path is exercised too
+BAD_ROWS = 0.001
+
+
+def write_archive(path, num_rows, teams, maps, rng):
+
+    # spreadsheet-style rows: loose casing and display names instead of map entries
+    display = [entry.split("__")[1] for entries in maps.values() for entry in entries]
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["Week", "Match", "Team 1", "Team 2", "Map", "Winner"])
+        rows = week = 0
+        while rows < num_rows:
+            week += 1
+            order = rng.sample(teams, len(teams))
+            for match_num in range(len(order) // 2):
+                team1, team2 = order[2 * match_num], order[2 * match_num + 1]
+                if rng.random() < BAD_ROWS:
+                    team1 += " (old name)"
+                for _ in range(rng.randint(3, 6)):
+                    winner = rng.choice((team1, team2.lower(), "Draw"))
+                    writer.writerow([week, match_num + 1, team1, team2.upper(), rng.choice(display).lower(), winner])
+                    rows += 1
+                    if rows >= num_rows:
+                        return rows
+    return rows
+
+
+def bench(num_rows, rng, memory=False):
+    with tempfile.TemporaryDirectory() as directory:
+        teams, maps = write_league(directory, TEAMS)
+        archive = os.path.join(directory, 'archive.csv')
+        write_archive(archive, num_rows, teams, maps, rng)
+        store = SeasonStore(os.path.join(directory, 'season_results.jsonl'))
+        catalog = Catalog(os.path.join(directory, 'teams.json'), os.path.join(directory, 'maps.json'))
+
+        # tracing allocations slows the import several times over, so peak memory is opt-in
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        report = Importer(store, catalog).run([archive])
+        elapsed = time.perf_counter() - start
+        peak = None
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return {
+            "rows": report["rows"],
+            "matches": report["matches"],
+            "rejected": report["rejected"],
+            "seconds": elapsed,
+            "rows_per_second": report["rows"] / elapsed,
+            "archive_mb": os.path.getsize(archive) / 1e6,
+            "peak_mb": peak / 1e6 if peak is not None else None
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import throughput and peak memory for CSV archives.")
+    parser.add_argument("--rows", default=",".join(map(str, ROWS)), help="comma separated game row counts")
+    parser.add_argument("--seed", type=int, default=20)
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory (much slower)")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    for num_rows in (int(size) for size in args.rows.split(",")):
+        result = bench(num_rows, rng, args.memory)
+        line = (
+            f"{result['rows']:9d} rows ({result['archive_mb']:6.1f} MB): {result['seconds']:7.2f}s, "
+            f"{result['rows_per_second']:8.0f} rows/s, {result['matches']} matches, {result['rejected']} rejected"
+        )
+        if result["peak_mb"] is not None:
+            line += f", peak {result['peak_mb']:.1f} MB"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
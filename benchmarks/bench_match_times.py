@@ -0,0 +1,47 @@
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from match_times import IntervalIndex, format_time, parse_time, upcoming_friday  # noqa: E402
+
+RUNS = 20
+
+
+def timed(function):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        result = function()
+    return (time.perf_counter() - start) / RUNS * 1000, result
+
+
+def main():
+    random.seed(7)
+    friday = upcoming_friday()
+    texts = [f"{random.choice(['fri', 'sat', 'sun'])} {random.randint(1, 11)}:{random.choice(['00', '30'])}pm est" for _ in range(500)]
+
+    for num_matches in (100, 250, 500):
+        parse_ms, starts = timed(lambda: [parse_time(text, friday) for text in texts[:num_matches]])
+        index = IntervalIndex()
+        for number, start in enumerate(starts, start=1):
+            index.add(number, start)
+
+        overlap_ms, pairs = timed(index.overlaps)
+        query_ms, _ = timed(lambda: [index.overlapping(start) for start in starts])
+        stream_ms, streamed = timed(lambda: index.max_streamable(3))
+        window = friday.replace(hour=12)
+        free_ms, free = timed(lambda: index.free_slots(window, window + datetime.timedelta(days=3), 3))
+
+        print(f"{len(starts)} matches:")
+        print(f"  parse all:        {parse_ms:7.2f} ms")
+        print(f"  all overlaps:     {overlap_ms:7.2f} ms ({len(pairs)} pairs)")
+        print(f"  overlap per match {query_ms / len(starts) * 1000:7.2f} us")
+        print(f"  3 streams:        {stream_ms:7.2f} ms ({len(streamed)} streamed)")
+        print(f"  free slots:       {free_ms:7.2f} ms ({len(free)} free, first {format_time(free[0]) if free else '-'})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import os
+import sys
+import time
+import tracemalloc
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import Match  # noqa: E402
+
+NUM_MATCHES = 5000
+NUM_GAMES = 5
+
+
+def build_var_matches(interp):
+
+    # the old layout: a dict of tk variables per match and per game
+    matches = []
+    for _ in range(NUM_MATCHES):
+        match_info = {
+            "team1": tk.StringVar(interp),
+            "team2": tk.StringVar(interp),
+            "games": tk.IntVar(interp, value=NUM_GAMES),
+            "game_widgets": []
+        }
+        for _ in range(NUM_GAMES):
+            match_info["game_widgets"].append({"map": tk.StringVar(interp), "winner": tk.StringVar(interp)})
+        matches.append(match_info)
+    return matches
+
+
+def build_model_matches():
+    return [Match(match_num, num_games=NUM_GAMES) for match_num in range(1, NUM_MATCHES + 1)]
+
+
+def read_var_matches(matches):
+    for match_info in matches:
+        match_info["team1"].get()
+        match_info["team2"].get()
+        for game in match_info["game_widgets"]:
+            game["map"].get()
+            game["winner"].get()
+
+
+def read_model_matches(matches):
+    for match in matches:
+        match.team1
+        match.team2
+        for game in match.games:
+            game.map
+            game.winner
+
+
+def measure(build):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    matches = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return matches, (after - before) / NUM_MATCHES
+
+
+def timed(read, matches):
+    start = time.perf_counter()
+    read(matches)
+    return time.perf_counter() - start
+
+
+def main():
+
+    # a bare tcl interpreter is enough for variables, no display needed
+    interp = tk.Tcl()
+
+    # tracemalloc only sees the python side, tcl keeps its own copy of every variable
+    var_matches, var_bytes = measure(lambda: build_var_matches(interp))
+    model_matches, model_bytes = measure(build_model_matches)
+
+    print(f"{NUM_MATCHES} matches x {NUM_GAMES} games")
+    print(f"dict of tk vars: {var_bytes:8.0f} bytes/match (python side), read {timed(read_var_matches, var_matches) * 1000:.1f} ms")
+    print(f"slotted records: {model_bytes:8.0f} bytes/match, read {timed(read_model_matches, model_matches) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
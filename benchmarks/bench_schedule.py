@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scheduler import round_robin, swiss_round  # noqa: E402
+from standings import Standings  # noqa: E402
+
+
+def bench_round_robin(num_teams):
+    teams = [f"Team {i}" for i in range(num_teams)]
+    start = time.perf_counter()
+    schedule = round_robin(teams)
+    elapsed = time.perf_counter() - start
+    print(f"round robin  {num_teams:5d} teams, {len(schedule):5d} rounds: {elapsed * 1000:8.1f} ms")
+
+
+def bench_swiss(num_teams, num_rounds):
+    rng = random.Random(11)
+    teams = [f"Team {i}" for i in range(num_teams)]
+    standings = Standings(teams)
+    byes = {}
+    rematches = 0
+    elapsed = 0.0
+
+    for week in range(1, num_rounds + 1):
+        start = time.perf_counter()
+        pairs, bye = swiss_round(teams, standings, byes)
+        elapsed += time.perf_counter() - start
+
+        if bye is not None:
+            byes[bye] = byes.get(bye, 0) + 1
+        entries = []
+        for team1, team2 in pairs:
+            if team2 in standings.records[team1].head_to_head:
+                rematches += 1
+            winner = rng.choice([team1, team2])
+            entries.append({"team1": team1, "team2": team2, "games": [{"map": "Busan", "winner": winner}], "overall_winner": winner})
+        standings.apply_week(week, entries)
+
+    print(f"swiss        {num_teams:5d} teams, {num_rounds:5d} rounds: {elapsed * 1000:8.1f} ms ({rematches} rematches)")
+
+
+def main():
+    for num_teams in (10, 100, 1000, 2000, 5000):
+        bench_round_robin(num_teams)
+    for num_teams in (100, 1000, 5000):
+        bench_swiss(num_teams, 10)
+
+
+if __name__ == "__main__":
+    main()
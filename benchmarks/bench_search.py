@@ -0,0 +1,46 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search import NameIndex  # noqa: E402
+
+NUM_NAMES = 10000
+RUNS = 1000
+WORDS = ["Blue", "Red", "Fox", "Tigers", "Owls", "Night", "Storm", "Kings", "Dragons", "Pixel", "Echo", "Nova"]
+
+
+def linear_search(names, query):
+
+    # what filtering the full list on every keystroke would cost
+    query = query.casefold()
+    return [name for name in names if query in name.casefold()][:50]
+
+
+def main():
+    random.seed(5)
+    names = sorted({f"{random.choice(WORDS)} {random.choice(WORDS)} {num}" for num in range(NUM_NAMES)})
+
+    start = time.perf_counter()
+    index = NameIndex(names)
+    print(f"{len(names)} names, index built in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # every other team already assigned, the way the team dropdowns filter
+    assigned = dict.fromkeys(names[::2])
+    for query in ["", "n", "no", "nova", "nova red", "ight", "orm 12", "xyz"]:
+        start = time.perf_counter()
+        for _ in range(RUNS):
+            results = index.search(query, exclude=assigned)
+        indexed = (time.perf_counter() - start) / RUNS * 1000
+
+        start = time.perf_counter()
+        for _ in range(RUNS // 20):
+            linear_search(names, query)
+        linear = (time.perf_counter() - start) / (RUNS // 20) * 1000
+        print(f"  {query!r:12s} {indexed:7.4f} ms indexed, {linear:7.3f} ms linear scan, {len(results)} results")
+
+
+if __name__ == "__main__":
+    main()
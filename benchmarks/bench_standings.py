@@ -0,0 +1,54 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from standings import Standings, render_standings  # noqa: E402
+
+NUM_TEAMS = 500
+NUM_WEEKS = 20
+
+
+def make_week(teams, rng):
+    teams = teams[:]
+    rng.shuffle(teams)
+    entries = []
+    for i in range(0, len(teams) - 1, 2):
+        team1, team2 = teams[i], teams[i + 1]
+        games = [{"map": "Busan", "winner": rng.choice([team1, team2, "Draw"])} for _ in range(3)]
+        wins1 = sum(1 for game in games if game["winner"] == team1)
+        wins2 = sum(1 for game in games if game["winner"] == team2)
+        overall = team1 if wins1 > wins2 else team2 if wins2 > wins1 else "Draw"
+        entries.append({"team1": team1, "team2": team2, "games": games, "overall_winner": overall})
+    return entries
+
+
+def main():
+    rng = random.Random(7)
+    teams = [f"Team {i}" for i in range(NUM_TEAMS)]
+    weeks = [make_week(teams, rng) for _ in range(NUM_WEEKS + 1)]
+
+    start = time.perf_counter()
+    standings = Standings(teams)
+    for week, entries in enumerate(weeks[:-1], start=1):
+        standings.apply_week(week, entries)
+    season = time.perf_counter() - start
+
+    start = time.perf_counter()
+    standings.apply_week(NUM_WEEKS + 1, weeks[-1])
+    incremental = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_standings(standings)
+    table = time.perf_counter() - start
+
+    print(f"{NUM_TEAMS} teams, {NUM_WEEKS} weeks")
+    print(f"full season:  {season * 1000:.1f} ms")
+    print(f"one new week: {incremental * 1000:.2f} ms")
+    print(f"render table: {table * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+import tempfile
+from league import MODES, write_league
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+LOAD_CATALOG = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+from catalog import Catalog
+catalog = Catalog({teams!r}, {maps!r})
+catalog.teams
+catalog.maps
+print(time.perf_counter() - start)
+"""
+
+IMPORT_GUI = """
+import sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+
+def run(script):
+
+    # a fresh interpreter each time, like a real launch
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def best_of(script, before=None):
+    times = []
+    for _ in range(RUNS):
+        if before:
+            before()
+        times.append(run(script))
+    return min(times)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        write_league(directory, 10000, 2000, reverse=True)
+        teams_path = os.path.join(directory, 'teams.json')
+        maps_path = os.path.join(directory, 'maps.json')
+        script = LOAD_CATALOG.format(root=ROOT, teams=teams_path, maps=maps_path)
+
+        def clear_cache():
+            for path in (teams_path, maps_path):
+                if os.path.exists(path + '.cache'):
+                    os.remove(path + '.cache')
+
+        cold = best_of(script, clear_cache)
+        run(script)
+        warm = best_of(script)
+
+        print(f"catalog: 10000 teams, {len(MODES)} modes x 2000 maps")
+        print(f"cold (parse + build cache): {cold * 1000:7.1f} ms")
+        print(f"warm (cached):              {warm * 1000:7.1f} ms")
+
+    try:
+        gui = best_of(IMPORT_GUI.format(root=ROOT))
+        print(f"import main (tkinter + app modules): {gui * 1000:7.1f} ms")
+    except subprocess.CalledProcessError:
+        print("import main: tkinter not available")
+
+
+if __name__ == "__main__":
+    main()
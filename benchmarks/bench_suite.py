@@ -0,0 +1,307 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from announcement import announcement_sections, pack_messages  # noqa: E402
+from league import MODES, write_league  # noqa: E402
+from conflicts import NEXT_WEEK, THIS_WEEK, AssignmentIndex  # noqa: E402
+from match_times import upcoming_friday  # noqa: E402
+from models import MAX_GAMES, MIN_GAMES, Game, Week, add_game, new_matches, new_schedule, remove_game  # noqa: E402
+from season_store import SeasonStore, save_week  # noqa: E402
+from utils import load_maps, load_teams  # noqa: E402
+
+SIZES = [10, 100, 1000, 10000]
+RUNS = 5
+
+# a slowdown beyond this fraction of the baseline counts as a regression
+THRESHOLD = 0.2
+
+
+def fill_week(matches, next_week_matches, teams, maps, rng):
+
+    # every match complete with 3-6 games, next week pairs teams one seat over
+    for match_num, match in enumerate(matches):
+        match.team1 = teams[2 * match_num]
+        match.team2 = teams[2 * match_num + 1]
+        match.games = [
+            Game(rng.choice(maps[mode]), rng.choice((match.team1, match.team2, "Draw")))
+            for mode in MODES[:rng.randint(MIN_GAMES, MAX_GAMES)]
+        ]
+    for match_num, match in enumerate(next_week_matches):
+        match.team1 = teams[2 * match_num + 1]
+        match.team2 = teams[(2 * match_num + 2) % len(teams)]
+
+
+def timed(function, runs, setup=None):
+    times = []
+    for _ in range(runs):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+class CoreLeague:
+
+    # the app's model-level work without any widgets, through the same functions main.py calls
+    mode = "core"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.teams = load_teams(os.path.join(directory, 'teams.json'))
+        self.maps = load_maps(os.path.join(directory, 'maps.json'))
+        self.num_matches = len(self.teams) // 2
+        self.bye_team = "" if len(self.teams) % 2 else None
+        self.assignments = AssignmentIndex()
+        self.store = SeasonStore(os.path.join(directory, 'season_results.jsonl'))
+        self.last_week_file = os.path.join(directory, 'last_week_matches.json')
+
+        # regenerating within a session replaces the same week, as in the app
+        self.week_number = self.store.next_week()
+        self.render_matches()
+        self.render_next_week_matches()
+
+    def render_matches(self):
+        self.matches = new_matches(self.num_matches)
+        self.assignments.load(THIS_WEEK, self.matches)
+
+    def render_next_week_matches(self):
+        self.next_week_matches = new_schedule(self.num_matches, upcoming_friday())
+        self.assignments.load(NEXT_WEEK, self.next_week_matches, self.bye_team)
+
+    def fill(self, rng):
+        fill_week(self.matches, self.next_week_matches, self.teams, self.maps, rng)
+        self.assignments.load(THIS_WEEK, self.matches)
+        self.assignments.load(NEXT_WEEK, self.next_week_matches, self.bye_team)
+
+    def num_games(self, match_num):
+        return len(self.matches[match_num - 1].games)
+
+    def increment_game(self, match_num):
+        add_game(self.matches[match_num - 1])
+
+    def decrement_game(self, match_num):
+        remove_game(self.matches[match_num - 1])
+
+    def generate_announcement(self):
+        sections, self.last_week_data = announcement_sections(
+            Week(self.matches, self.next_week_matches, self.bye_team), None, self.week_number
+        )
+        pack_messages(sections)
+
+    def save_last_week_matches(self):
+        save_week(self.store, self.week_number, self.last_week_data, self.last_week_file)
+
+    def close(self):
+        self.store.close()
+
+
+class GuiLeague:
+
+    # the real window, withdrawn, under whatever display is available (e.g. xvfb-run)
+    mode = "gui"
+
+    def __init__(self, directory):
+        from divisions import Division
+        from main import UTOWPocketCoordinator
+
+        self.app = UTOWPocketCoordinator(Division("", directory))
+        self.app.withdraw()
+        self.app.update()
+        self.num_matches = self.app.num_matches
+
+    def render_matches(self):
+        self.app.render_matches()
+        self.app.update_idletasks()
+
+    def render_next_week_matches(self):
+        self.app.render_next_week_matches()
+        self.app.update_idletasks()
+
+    def fill(self, rng):
+        app = self.app
+        fill_week(app.matches, app.next_week_matches, app.teams, app.maps, rng)
+        app.assignments.load(THIS_WEEK, app.matches)
+        app.assignments.load(NEXT_WEEK, app.next_week_matches, app.bye_team)
+        app.match_list.set_items(app.matches)
+        app.next_week_list.set_items(app.next_week_matches)
+        app.update()
+
+    def num_games(self, match_num):
+        return len(self.app.matches[match_num - 1].games)
+
+    def increment_game(self, match_num):
+        self.app.increment_game(match_num)
+        self.app.update_idletasks()
+
+    def decrement_game(self, match_num):
+        self.app.decrement_game(match_num)
+        self.app.update_idletasks()
+
+    def generate_announcement(self):
+
+        # the app saves as part of generating, so this includes one save
+        self.app.generate_announcement()
+        self.app.update_idletasks()
+
+    def save_last_week_matches(self):
+        with open(self.app.last_week_file, 'r', encoding='utf-8') as file:
+            self.app.save_last_week_matches(json.load(file))
+
+    def close(self):
+        self.app.on_close()
+
+
+def display_available():
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.destroy()
+        return True
+    except Exception:
+        return False
+
+
+def bench_size(league_class, num_teams, runs, rng):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        write_league(directory, num_teams)
+        teams_path = os.path.join(directory, 'teams.json')
+        maps_path = os.path.join(directory, 'maps.json')
+
+        def clear_cache():
+            for path in (teams_path, maps_path):
+                if os.path.exists(path + '.cache'):
+                    os.remove(path + '.cache')
+
+        results["load_teams_cold"] = timed(lambda: load_teams(teams_path), runs, clear_cache)
+        results["load_teams_warm"] = timed(lambda: load_teams(teams_path), runs)
+        results["load_maps_cold"] = timed(lambda: load_maps(maps_path), runs, clear_cache)
+        results["load_maps_warm"] = timed(lambda: load_maps(maps_path), runs)
+
+        league = league_class(directory)
+        try:
+            results["render_matches"] = timed(league.render_matches, runs)
+            results["render_next_week_matches"] = timed(league.render_next_week_matches, runs)
+            league.fill(rng)
+
+            # grow and shrink a match in the middle of the list, where it is least likely to be on screen,
+            # starting from 4 games so neither direction hits a limit warning
+            middle = max(league.num_matches // 2, 1)
+            while league.num_games(middle) < MIN_GAMES + 1:
+                league.increment_game(middle)
+            while league.num_games(middle) > MIN_GAMES + 1:
+                league.decrement_game(middle)
+            results["increment_game"] = timed(lambda: league.increment_game(middle), runs, lambda: league.decrement_game(middle))
+            results["decrement_game"] = timed(lambda: league.decrement_game(middle), runs, lambda: league.increment_game(middle))
+
+            # the edits left blank games behind, refill so the week is complete again
+            league.fill(rng)
+            results["generate_announcement"] = timed(league.generate_announcement, runs)
+            results["save_last_week_matches"] = timed(league.save_last_week_matches, runs)
+        finally:
+            league.close()
+
+    return [
+        {
+            "teams": num_teams,
+            "operation": operation,
+            "runs": len(times),
+            "best_ms": min(times) * 1000,
+            "median_ms": statistics.median(times) * 1000
+        }
+        for operation, times in results.items()
+    ]
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+
+    # medians are compared, and only for size/operation pairs both runs have
+    before = {(row["teams"], row["operation"]): row["median_ms"] for row in baseline["results"]}
+    regressions = []
+    for row in results:
+        old = before.get((row["teams"], row["operation"]))
+        if old and row["median_ms"] > old * (1 + threshold) and row["median_ms"] - old > 0.05:
+            regressions.append((row, old))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the app's load, render, edit, generate and save paths.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma separated team counts")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--mode", choices=["auto", "core", "gui"], default="auto")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--compare", help="an earlier results file, exits 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args(argv)
+
+    mode = args.mode
+    if mode == "auto":
+        mode = "gui" if display_available() else "core"
+    league_class = GuiLeague if mode == "gui" else CoreLeague
+
+    rng = random.Random(args.seed)
+    results = []
+    for num_teams in (int(size) for size in args.sizes.split(",")):
+        rows = bench_size(league_class, num_teams, args.runs, rng)
+        results.extend(rows)
+        print(f"{num_teams} teams ({mode}):")
+        for row in rows:
+            print(f"  {row['operation']:26s} {row['median_ms']:9.3f} ms median, {row['best_ms']:9.3f} ms best")
+
+    report = {
+        "meta": {
+            "mode": mode,
+            "runs": args.runs,
+            "seed": args.seed,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
+        },
+        "results": results
+    }
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+    print(f"wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        if baseline["meta"].get("mode") != mode:
+            print(f"warning: comparing {mode} results against {baseline['meta'].get('mode')} results")
+        regressions = compare(results, baseline, args.threshold)
+        for row, old in regressions:
+            print(f"REGRESSION {row['teams']} teams {row['operation']}: {old:.3f} -> {row['median_ms']:.3f} ms")
+        if regressions:
+            return 1
+        print(f"no regressions against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from webhook import WebhookPublisher  # noqa: E402
+from webhook_stub import StubWebhookServer  # noqa: E402
+
+MESSAGES_PER_CHANNEL = 200
+
+
+async def bench(num_channels, reset_after=0.0, bucket_size=5, messages=MESSAGES_PER_CHANNEL):
+    async with StubWebhookServer(reset_after=reset_after, bucket_size=bucket_size) as server:
+        jobs = {
+            f"{server.url}/api/webhooks/{channel}/token": [f"message {i}" for i in range(messages)]
+            for channel in range(num_channels)
+        }
+        publisher = WebhookPublisher()
+        start = time.perf_counter()
+        outcomes = await publisher.publish_all(jobs)
+        elapsed = time.perf_counter() - start
+        publisher.close()
+
+        # every channel must have received its messages in order
+        in_order = all(
+            server.received.get(url[len(server.url):]) == messages_sent
+            for url, messages_sent in jobs.items()
+        )
+        failures = sum(1 for outcome in outcomes.values() if outcome is not None)
+        return publisher.sent / elapsed, in_order, failures, server.rate_limited
+
+
+async def main():
+    print("unlimited stub:")
+    for num_channels in (1, 10, 50):
+        rate, in_order, failures, _ = await bench(num_channels)
+        print(f"  {num_channels:3d} channels: {rate:8.0f} msg/s, in order: {in_order}, failures: {failures}")
+
+    print("rate limited stub (5 per 0.2 s per channel):")
+    for num_channels in (1, 10, 50):
+        rate, in_order, failures, limited = await bench(num_channels, reset_after=0.2, messages=20)
+        print(f"  {num_channels:3d} channels: {rate:8.0f} msg/s, in order: {in_order}, failures: {failures}, 429s: {limited}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
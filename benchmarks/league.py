@@ -0,0 +1,21 @@
+import json
+import os
+
+MODES = ["control", "hybrid", "flashpoint", "push", "escort", "clash"]
+MAPS_PER_MODE = 12
+
+
+def write_league(directory, num_teams, maps_per_mode=MAPS_PER_MODE, reverse=False):
+
+    # synthetic teams.json and maps.json; reversed lists make the catalog build do real sorting
+    teams = [f"Team {i:05d}" for i in range(num_teams)]
+    maps = {mode: [f":flag_{i}: __{mode.title()} {i}__" for i in range(maps_per_mode)] for mode in MODES}
+    if reverse:
+        teams.reverse()
+        for map_list in maps.values():
+            map_list.reverse()
+    with open(os.path.join(directory, 'teams.json'), 'w', encoding='utf-8') as file:
+        json.dump(teams, file)
+    with open(os.path.join(directory, 'maps.json'), 'w', encoding='utf-8') as file:
+        json.dump(maps, file)
+    return teams, maps
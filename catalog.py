@@ -0,0 +1,105 @@
+import marshal
+import os
+from operator import itemgetter
+
+CACHE_VERSION = 1
+
+
+def display_name(map_entry):
+
+    # ":flag_kr: __Busan__" -> "Busan"
+    return map_entry.split("__")[1].split("__")[0].strip()
+
+
+def build_teams(teams):
+    return sorted(teams)
+
+
+def build_maps(maps):
+
+    # parse each display name once, then sort on the parsed key
+    catalog = {}
+    for game_mode, map_list in maps.items():
+        keyed = [(display_name(map_entry), map_entry) for map_entry in map_list]
+        catalog[game_mode] = sorted(keyed, key=itemgetter(0))
+    return catalog
+
+
+def maps_by_mode(map_entries):
+    return {game_mode: [map_entry for _, map_entry in entries] for game_mode, entries in map_entries.items()}
+
+
+def load_cached(file_path, build, cache_path=None):
+    cache_path = cache_path or file_path + '.cache'
+    stat = os.stat(file_path)
+
+    cached = None
+    try:
+        # one read + loads, marshal.load on a file reads in small chunks
+        with open(cache_path, 'rb') as file:
+            cached = marshal.loads(file.read())
+        if (
+            cached["version"] == CACHE_VERSION
+            and cached["mtime"] == stat.st_mtime_ns
+            and cached["size"] == stat.st_size
+        ):
+            return cached["data"]
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        cached = None
+
+    # json and hashlib are only needed to rebuild, keep them off the warm path
+    import hashlib
+    import json
+
+    with open(file_path, 'rb') as file:
+        raw = file.read()
+    digest = hashlib.sha1(raw).hexdigest()
+
+    # touched but unchanged files keep their catalog, only the stamp is refreshed
+    if cached and cached.get("version") == CACHE_VERSION and cached.get("hash") == digest:
+        data = cached["data"]
+    else:
+        data = build(json.loads(raw.decode('utf-8')))
+
+    cache = {"version": CACHE_VERSION, "mtime": stat.st_mtime_ns, "size": stat.st_size, "hash": digest, "data": data}
+    try:
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'wb') as file:
+            file.write(marshal.dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+
+        # a read-only directory just means no cache
+        pass
+    return data
+
+
+class Catalog:
+    def __init__(self, teams_path='teams.json', maps_path='maps.json'):
+        self.teams_path = teams_path
+        self.maps_path = maps_path
+        self._teams = None
+        self._map_entries = None
+        self._maps = None
+
+    @property
+    def teams(self):
+        if self._teams is None:
+            self._teams = load_cached(self.teams_path, build_teams)
+        return self._teams
+
+    @property
+    def map_entries(self):
+
+        # game mode -> [(display name, map entry)], sorted by display name
+        if self._map_entries is None:
+            self._map_entries = load_cached(self.maps_path, build_maps)
+        return self._map_entries
+
+    @property
+    def maps(self):
+
+        # same shape as load_maps: game mode -> sorted map entries
+        if self._maps is None:
+            self._maps = maps_by_mode(self.map_entries)
+        return self._maps
@@ -0,0 +1,72 @@
+import argparse
+import json
+import sys
+from announcement import AnnouncementError, MESSAGE_LIMIT, announcement_sections, pack_messages
+from models import Week
+
+
+def read_weeks(file, fmt):
+
+    # jsonl: one week per line, json: a single week or a list of weeks
+    if fmt == "jsonl":
+        for line in file:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+        return
+
+    data = json.load(file)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate UTOW announcements from week files.")
+    parser.add_argument("week_file", help="JSON/JSONL week file, or - for stdin")
+    parser.add_argument("--format", choices=["auto", "json", "jsonl"], default="auto")
+    parser.add_argument(
+        "--messages", action="store_true",
+        help="write one JSON list of message chunks per week instead of plain text"
+    )
+    parser.add_argument("--message-limit", type=int, default=MESSAGE_LIMIT)
+    args = parser.parse_args(argv)
+
+    fmt = args.format
+    if fmt == "auto":
+        fmt = "jsonl" if args.week_file.endswith(".jsonl") else "json"
+
+    if args.week_file == "-":
+        file = sys.stdin
+    else:
+        file = open(args.week_file, 'r', encoding='utf-8')
+
+    failed = 0
+    written = 0
+    with file:
+        for week_num, week in enumerate(read_weeks(file, fmt), start=1):
+            try:
+                sections, _ = announcement_sections(Week.from_dict(week))
+            except AnnouncementError as e:
+                name = week.get("division") or f"week {week_num}"
+                print(f"{name}: {e.title}: {e.message}", file=sys.stderr)
+                failed += 1
+                continue
+
+            if args.messages:
+                messages = pack_messages(sections, args.message_limit)
+                sys.stdout.write(json.dumps(messages, ensure_ascii=False) + "\n")
+                continue
+
+            # blank line between divisions
+            if written:
+                sys.stdout.write("\n")
+            sys.stdout.write("".join(block for section in sections for block in section))
+            written += 1
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+THIS_WEEK = "this_week"
+NEXT_WEEK = "next_week"
+
+# the bye takes a team out of next week's schedule
+BYE_SLOT = "bye"
+
+
+class AssignmentIndex:
+    def __init__(self):
+
+        # per week: slot -> team, team -> slots, and the teams booked more than once
+        self.slots = {THIS_WEEK: {}, NEXT_WEEK: {}}
+        self.places = {THIS_WEEK: {}, NEXT_WEEK: {}}
+        self.conflicts = {THIS_WEEK: set(), NEXT_WEEK: set()}
+
+    @classmethod
+    def from_week(cls, week):
+        index = cls()
+        index.load(THIS_WEEK, week.matches)
+        index.load(NEXT_WEEK, week.next_week, week.bye_team)
+        return index
+
+    def load(self, scope, matches, bye_team=None):
+
+        # bulk assignment after a new week, a schedule fill or a restore
+        self.slots[scope] = {}
+        self.places[scope] = {}
+        self.conflicts[scope] = set()
+        for match_index, match in enumerate(matches):
+            self.assign(scope, (match_index, 1), match.team1)
+            self.assign(scope, (match_index, 2), match.team2)
+        if bye_team:
+            self.assign(scope, BYE_SLOT, bye_team)
+
+    def assign(self, scope, slot, team):
+
+        # returns the slots whose conflict state may have changed
+        slots = self.slots[scope]
+        places = self.places[scope]
+        old_team = slots.get(slot, "")
+        if old_team == team:
+            return set()
+
+        affected = {slot}
+        if old_team:
+            old_places = places[old_team]
+            old_places.discard(slot)
+            affected |= old_places
+            if len(old_places) < 2:
+                self.conflicts[scope].discard(old_team)
+            if not old_places:
+                del places[old_team]
+
+        if team:
+            slots[slot] = team
+            new_places = places.setdefault(team, set())
+            new_places.add(slot)
+            affected |= new_places
+            if len(new_places) > 1:
+                self.conflicts[scope].add(team)
+        else:
+            slots.pop(slot, None)
+        return affected
+
+    def assigned(self, scope):
+
+        # team -> slots, so "team in assigned" is a dict lookup
+        return self.places[scope]
+
+    def count(self, scope, team):
+        return len(self.places[scope].get(team, ()))
+
+    def is_conflict(self, scope, team):
+        return team in self.conflicts[scope]
+
+    def describe(self, scope, team):
+        count = self.count(scope, team)
+        week = "this week" if scope == THIS_WEEK else "next week"
+        if BYE_SLOT in self.places[scope].get(team, ()):
+            return f"{team} has the bye but is also booked {count - 1} time(s) {week}"
+        return f"{team} is booked {count} times {week}"
+
+    def first_conflict(self):
+        for scope in (THIS_WEEK, NEXT_WEEK):
+            if self.conflicts[scope]:
+                return scope, min(self.conflicts[scope])
+        return None
@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from announcement import AnnouncementError, MESSAGE_LIMIT, announcement_sections, pack_messages
+from autosave import load_session, restore_session
+from catalog import Catalog
+from models import Week
+from season_store import SeasonStore, save_week
+from standings import Standings
+from utils import write_atomic
+
+MANIFEST_FILE = 'divisions.json'
+
+# per-division files, relative to the division's directory unless overridden
+DIVISION_FILES = {
+    "teams": 'teams.json',
+    "maps": 'maps.json',
+    "last_week": 'last_week_matches.json',
+    "season": 'season_results.jsonl',
+    "session": 'autosave.json',
+    "announcement": 'announcement.txt'
+}
+
+
+class Division:
+    __slots__ = ("name", "directory", "teams", "maps", "last_week", "season", "session", "announcement", "week", "standings")
+
+    def __init__(self, name, directory='.', week=None, standings=False, **paths):
+        self.name = name
+        self.directory = directory
+        for key, default in DIVISION_FILES.items():
+            setattr(self, key, os.path.join(directory, paths.get(key) or default))
+
+        # a week file in the cli format, otherwise the division's autosaved form is used
+        self.week = os.path.join(directory, week) if week else None
+        self.standings = standings
+
+    @classmethod
+    def from_dict(cls, data, base='.', standings=False):
+        paths = {key: data[key] for key in DIVISION_FILES if data.get(key)}
+        return cls(
+            data["name"],
+            os.path.join(base, data.get("directory", data["name"])),
+            data.get("week"),
+            data.get("standings", standings),
+            **paths
+        )
+
+    @classmethod
+    def from_paths(cls, paths):
+
+        # rebuild from to_dict in a worker, paths are already resolved
+        division = cls.__new__(cls)
+        for key in cls.__slots__:
+            setattr(division, key, paths[key])
+        return division
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+def load_manifest(path=MANIFEST_FILE):
+
+    # {"standings": false, "divisions": [{"name": ..., "directory": ..., "teams": ...}]}
+    with open(path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+    if isinstance(manifest, list):
+        manifest = {"divisions": manifest}
+
+    base = os.path.dirname(os.path.abspath(path))
+    standings = manifest.get("standings", False)
+    divisions = [Division.from_dict(entry, base, standings) for entry in manifest["divisions"]]
+
+    seen = set()
+    duplicates = sorted({division.name for division in divisions if division.name in seen or seen.add(division.name)})
+    if duplicates:
+        raise ValueError(f"Duplicate division names in {path}: {', '.join(duplicates)}")
+    return divisions
+
+
+def check_catalog(week, teams, maps):
+
+    # a division's form can only name its own teams and maps
+    known_maps = {map_entry for entries in maps.values() for map_entry in entries}
+    for match in week.matches:
+        for team in (match.team1, match.team2):
+            if team and team not in teams:
+                raise AnnouncementError("Unknown Team", f"In {match.label}, {team} is not in this division's teams.")
+        for game in match.games:
+            if game.map and game.map not in known_maps:
+                raise AnnouncementError("Unknown Map", f"In {match.label}, {game.map} is not in this division's maps.")
+    for match in week.next_week:
+        for team in (match.team1, match.team2):
+            if team and team not in teams:
+                raise AnnouncementError(
+                    "Unknown Team", f"In Next Week {match.label}, {team} is not in this division's teams."
+                )
+
+
+def load_week(division):
+
+    # the week number comes from the file or the saved form, never the store,
+    # so generating twice replaces the week instead of adding another one
+    state = load_session(division.session)
+    if division.week:
+        with open(division.week, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        week_number = data.get("week") or (state and state["week_number"])
+        if not week_number:
+            raise ValueError(f"{division.week} has no \"week\" number and there is no saved form to take it from")
+        return Week.from_dict(data), int(week_number)
+
+    if state is None:
+        raise FileNotFoundError(f"No saved form at {division.session}")
+    matches, next_week_matches, bye_team, week_number = restore_session(state)
+    return Week(matches, next_week_matches, bye_team), week_number
+
+
+def run_division(paths, save=True, limit=None):
+
+    # runs in a worker process, so everything comes back as plain data
+    division = Division.from_paths(paths)
+    start = time.perf_counter()
+    result = {"name": division.name, "ok": False, "title": "", "error": "", "messages": 0, "week": None}
+    try:
+        catalog = Catalog(division.teams, division.maps)
+        store = SeasonStore(division.season)
+        week, week_number = load_week(division)
+        check_catalog(week, set(catalog.teams), catalog.maps)
+
+        standings = Standings.from_store(store, catalog.teams) if division.standings else None
+        sections, last_week_data = announcement_sections(week, standings, week_number)
+        announcement = "".join(block for section in sections for block in section)
+
+        if save:
+            write_atomic(division.announcement, announcement.encode('utf-8'))
+            save_week(store, week_number, last_week_data, division.last_week)
+            store.close()
+
+        result.update(ok=True, week=week_number, messages=len(pack_messages(sections, limit or MESSAGE_LIMIT)))
+    except AnnouncementError as e:
+        result.update(title=e.title, error=e.message)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        result.update(title="Error", error=str(e))
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+
+def run_divisions(divisions, workers=None, save=True, limit=None, on_progress=None, mp_context=None):
+
+    # one task per division, results come back in manifest order
+    results = [None] * len(divisions)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        futures = {
+            pool.submit(run_division, division.to_dict(), save, limit): num
+            for num, division in enumerate(divisions)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            num = futures[future]
+            try:
+                results[num] = future.result()
+            except Exception as e:
+                results[num] = {
+                    "name": divisions[num].name, "ok": False, "title": "Error",
+                    "error": str(e), "messages": 0, "week": None, "elapsed": 0.0
+                }
+            if on_progress:
+                on_progress(results[num], done, len(divisions))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and generate announcements for every division.")
+    parser.add_argument("manifest", nargs="?", default=MANIFEST_FILE)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the core count")
+    parser.add_argument("--no-save", action="store_true", help="validate and generate without writing any files")
+    parser.add_argument("--message-limit", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        divisions = load_manifest(args.manifest)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"{args.manifest}: {e}", file=sys.stderr)
+        return 1
+
+    def progress(result, done, total):
+        if result["ok"]:
+            status = f"week {result['week']}, {result['messages']} message(s)"
+        else:
+            status = f"{result['title']}: {result['error']}"
+        print(f"[{done}/{total}] {result['name']}: {status} ({result['elapsed']:.2f}s)", file=sys.stderr)
+
+    start = time.perf_counter()
+    results = run_divisions(divisions, args.workers, not args.no_save, args.message_limit, progress)
+    failed = sum(1 for result in results if not result["ok"])
+    print(
+        f"{len(results) - failed} of {len(results)} divisions generated in {time.perf_counter() - start:.2f}s",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
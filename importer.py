@@ -0,0 +1,511 @@
+import argparse
+import csv
+import fnmatch
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from announcement import AnnouncementError, tally_match
+from catalog import Catalog
+from search import NameIndex, normalize
+from season_store import BEGIN, SeasonStore, map_key
+from utils import write_atomic
+
+# completed matches held in memory before one append + checkpoint
+FLUSH_MATCHES = 10000
+
+# input rows between progress reports
+PROGRESS_ROWS = 200000
+
+# distinct spellings remembered per name index before the cache starts over
+NAME_CACHE = 100000
+
+# header names spreadsheets use for each field
+COLUMNS = {
+    "week": ("week", "week_number", "week number", "week #", "wk"),
+    "match": ("match", "match_id", "match_number", "match number", "match #", "series"),
+    "team1": ("team1", "team_1", "team 1", "home", "home team"),
+    "team2": ("team2", "team_2", "team 2", "away", "away team"),
+    "map": ("map", "map_name", "map name"),
+    "winner": ("winner", "map_winner", "map winner", "game_winner", "game winner")
+}
+REQUIRED_COLUMNS = ("team1", "team2", "map", "winner")
+ALIASES = {alias: field for field, aliases in COLUMNS.items() for alias in aliases}
+
+DRAWS = {"draw", "tie", "tied", "d"}
+
+WEEK_NUMBER = re.compile(r"\d+")
+
+# the app's weekly dumps, the only files whose name may carry the week
+LAST_WEEK_DUMPS = "last_week_matches*.json"
+
+
+class ArchiveError(Exception):
+    pass
+
+
+class Rejected(Exception):
+    def __init__(self, reason, value=""):
+        super().__init__(reason)
+        self.reason = reason
+        self.value = value
+
+
+def fold(text):
+
+    # "Paraiso" typed in a spreadsheet is still "Paraíso"
+    return "".join(char for char in unicodedata.normalize("NFKD", normalize(text)) if not unicodedata.combining(char))
+
+
+def parse_week(value):
+    found = WEEK_NUMBER.search(str(value or ""))
+    if not found or int(found.group()) < 1:
+        raise Rejected("bad week", str(value or ""))
+    return int(found.group())
+
+
+def archive_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if extension == ".json":
+        return "json"
+    if extension in (".csv", ".tsv", ".txt"):
+        return "csv"
+    raise ArchiveError(f"{path}: unknown archive type, expected .csv, .tsv, .jsonl or .json")
+
+
+def file_week(path):
+
+    # only old dumps get their week from the name ("last_week_matches_12.json"),
+    # a number in any other file name is as likely a year as a week
+    name = os.path.basename(path)
+    if not fnmatch.fnmatch(name.lower(), LAST_WEEK_DUMPS):
+        return None
+    numbers = WEEK_NUMBER.findall(name)
+    return int(numbers[-1]) if numbers else None
+
+
+def missing_week(path, line=None):
+    where = f"{path}:{line}" if line is not None else path
+    return ArchiveError(f"{where}: no week number, add a week column or pass --week")
+
+
+def column_indexes(header):
+
+    # field -> column, the first matching column wins
+    columns = {}
+    for num, name in enumerate(header):
+        field = ALIASES.get(normalize(name.lstrip("\ufeff")))
+        if field and field not in columns:
+            columns[field] = num
+    return columns
+
+
+def decoded_lines(file, state):
+
+    # state is [byte offset, line count], kept current as csv pulls lines
+    for raw in file:
+        state[0] += len(raw)
+        state[1] += 1
+        yield raw.decode('utf-8', 'replace')
+
+
+def read_csv(path, position=0, line=0, week=None):
+    delimiter = "\t" if path.lower().endswith(".tsv") else ","
+    with open(path, 'rb') as file:
+        header = next(csv.reader(decoded_lines(file, [0, 0]), delimiter=delimiter), None)
+        if header is None:
+            return
+        columns = column_indexes(header)
+        missing = [field for field in REQUIRED_COLUMNS if field not in columns]
+        if missing:
+            raise ArchiveError(f"{path}: no column for {', '.join(missing)} in header {header}")
+        if "week" not in columns and week is None:
+            raise missing_week(path)
+
+        if position == 0:
+            position = file.tell()
+            line = 1
+        else:
+            file.seek(position)
+
+        state = [position, line]
+        fields = list(columns.items())
+        for row in csv.reader(decoded_lines(file, state), delimiter=delimiter):
+            start, start_line = position, line
+            position, line = state
+            if not any(row):
+                continue
+            record = {field: row[num].strip() if num < len(row) else "" for field, num in fields}
+            if week is not None and not record.get("week"):
+                record["week"] = week
+            yield start, start_line, record
+
+
+def read_jsonl(path, position=0, line=0, week=None):
+    with open(path, 'rb') as file:
+        file.seek(position)
+        mappings = {}
+        for raw in file:
+            start, start_line = position, line
+            position += len(raw)
+            line += 1
+            if not raw.strip():
+                continue
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                yield start, start_line, {"error": "bad json", "value": raw[:200].decode('utf-8', 'replace')}
+                continue
+            if not isinstance(data, dict):
+                yield start, start_line, {"error": "not an object", "value": raw[:200].decode('utf-8', 'replace')}
+                continue
+            if BEGIN in data:
+
+                # another install's season log, its append markers are not results
+                continue
+
+            if "games" in data:
+
+                # a match entry as the app writes it, or a line of another install's season log
+                record = {"week": data.get("week", week), "team1": data.get("team1"), "team2": data.get("team2")}
+                if record["week"] is None:
+                    raise missing_week(path, line)
+                games = data["games"]
+                if not isinstance(games, list) or not all(isinstance(game, dict) for game in games):
+                    yield start, start_line, {"error": "bad games", "value": str(games)[:200]}
+                    continue
+                record["games"] = [(game.get("map"), game.get("winner")) for game in games]
+            else:
+                keys = tuple(data)
+                columns = mappings.get(keys)
+                if columns is None:
+                    columns = mappings[keys] = [
+                        (ALIASES[normalize(key)], key) for key in keys if normalize(key) in ALIASES
+                    ]
+                record = {field: data[key] for field, key in columns}
+                if record.get("week") is None:
+                    if week is None:
+                        raise missing_week(path, line)
+                    record["week"] = week
+            yield start, start_line, record
+
+
+def read_json(path, position=0, line=0, week=None):
+
+    # last_week_matches.json dumps are one small week each, positions count entries
+    with open(path, 'r', encoding='utf-8') as file:
+        try:
+            data = json.load(file)
+        except ValueError as e:
+            raise ArchiveError(f"{path}: {e}")
+    if isinstance(data, dict):
+        week = data.get("week", week)
+        data = data.get("matches", [])
+    if not isinstance(data, list):
+        raise ArchiveError(f"{path}: expected a list of match entries")
+
+    for num in range(position, len(data)):
+        entry = data[num]
+        if not isinstance(entry, dict) or not isinstance(entry.get("games"), list):
+            yield num, num, {"error": "bad entry", "value": str(entry)[:200]}
+            continue
+        record = {"week": entry.get("week", week), "team1": entry.get("team1"), "team2": entry.get("team2")}
+        if record["week"] is None:
+            raise missing_week(path)
+        record["games"] = [(game.get("map"), game.get("winner")) for game in entry["games"] if isinstance(game, dict)]
+        yield num, num, record
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl, "json": read_json}
+
+
+class Importer:
+    def __init__(self, store, catalog, checkpoint_path=None, rejects_path=None, flush_matches=FLUSH_MATCHES,
+                 on_progress=None):
+        self.store = store
+        self.checkpoint_path = checkpoint_path or store.path + '.import.json'
+        self.rejects_path = rejects_path or store.path + '.rejects.jsonl'
+        self.flush_matches = flush_matches
+        self.on_progress = on_progress
+
+        # names resolve through the typeahead indexes, with an accent-blind fallback
+        self.teams = NameIndex(catalog.teams)
+        self.maps = NameIndex.from_pairs([pair for entries in catalog.map_entries.values() for pair in entries])
+        self.folded_teams = {fold(team): team for team in reversed(self.teams.values)}
+        self.folded_maps = {fold(key): num for num, key in reversed(list(enumerate(self.maps.keys)))}
+        self.team_cache = {}
+        self.map_cache = {}
+        self.winner_cache = {}
+
+        self.pending = {}
+        self.pending_count = 0
+        self.rejects = None
+
+    def team(self, name):
+        name = str(name or "").strip()
+        team = self.team_cache.get(name)
+        if team is None:
+            if not name:
+                raise Rejected("missing team")
+            team = self.teams.resolve(name) or self.folded_teams.get(fold(name)) or ""
+            if len(self.team_cache) >= NAME_CACHE:
+                self.team_cache.clear()
+            self.team_cache[name] = team
+        if not team:
+            raise Rejected("unknown team", name)
+        return team
+
+    def map(self, name):
+        name = str(name or "").strip()
+        map_name = self.map_cache.get(name)
+        if map_name is None:
+            if not name:
+                raise Rejected("missing map")
+
+            # the full entry, its display name, or the display name with stray markup
+            map_name = self.maps.resolve(name) or self.maps.resolve(map_key(name)) or ""
+            if not map_name:
+                num = self.folded_maps.get(fold(map_key(name)))
+                map_name = self.maps.values[num] if num is not None else ""
+            if len(self.map_cache) >= NAME_CACHE:
+                self.map_cache.clear()
+            self.map_cache[name] = map_name
+        if not map_name:
+            raise Rejected("unknown map", name)
+        return map_name
+
+    def winner(self, name, team1, team2):
+        name = str(name or "").strip()
+        if not name:
+            raise Rejected("missing winner")
+        winner = self.winner_cache.get(name)
+        if winner is None:
+            winner = "Draw" if normalize(name) in DRAWS else self.team(name)
+            if len(self.winner_cache) >= NAME_CACHE:
+                self.winner_cache.clear()
+            self.winner_cache[name] = winner
+        if winner != "Draw" and winner not in (team1, team2):
+            raise Rejected("winner not in match", name)
+        return winner
+
+    def build_match(self, rows):
+        first = rows[0][1]
+        if "error" in first:
+            raise Rejected(first["error"], first["value"])
+        week = parse_week(first.get("week"))
+        team1 = self.team(first.get("team1"))
+        team2 = self.team(first.get("team2"))
+        if "games" in first:
+            games = first["games"]
+        else:
+            games = []
+            for _, record in rows:
+                if self.team(record.get("team1")) != team1 or self.team(record.get("team2")) != team2:
+                    raise Rejected("teams differ within match", f"{record.get('team1')} vs {record.get('team2')}")
+                games.append((record.get("map"), record.get("winner")))
+        if not games:
+            raise Rejected("no games")
+
+        games = [(self.map(map_name), self.winner(winner, team1, team2)) for map_name, winner in games]
+        try:
+            return week, tally_match(f"Week {week}", team1, team2, games)
+        except AnnouncementError as e:
+            raise Rejected(e.title, e.message)
+
+    def finish(self, path, rows):
+        try:
+            week, entry = self.build_match(rows)
+        except Rejected as e:
+            self.stats["rejected"] += len(rows)
+            self.stats["reasons"][e.reason] = self.stats["reasons"].get(e.reason, 0) + len(rows)
+            for line, record in rows:
+                reject = {"file": path, "line": line, "reason": e.reason, "value": e.value, "row": record}
+                self.rejects.write(json.dumps(reject, ensure_ascii=False, default=str) + "\n")
+            return
+        self.pending.setdefault(week, []).append(entry)
+        self.pending_count += 1
+        self.stats["matches"] += 1
+        self.stats["games"] += len(entry["games"])
+
+    def flush(self, file_num, position, line):
+
+        # matches first, then the checkpoint that says they are in, so a crash in between is detectable
+        self.store.append_weeks([(week, self.batch, entries) for week, entries in sorted(self.pending.items())])
+        self.pending = {}
+        self.pending_count = 0
+        self.rejects.flush()
+        os.fsync(self.rejects.fileno())
+
+        checkpoint = {
+            "archives": self.archives,
+            "batch": self.batch,
+            "file": file_num,
+            "position": position,
+            "line": line,
+            "store_size": self.store.size,
+            "rejects_size": self.rejects.tell(),
+            "elapsed": self.elapsed(),
+            "stats": self.stats
+        }
+        write_atomic(self.checkpoint_path, json.dumps(checkpoint, indent=2).encode('utf-8'))
+
+    def elapsed(self):
+        return self.previous_elapsed + time.perf_counter() - self.started
+
+    def start(self, archives, restart=False):
+        self.archives = [os.path.abspath(path) for path in archives]
+        checkpoint = None
+        if os.path.exists(self.checkpoint_path) and not restart:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as file:
+                checkpoint = json.load(file)
+            if checkpoint["archives"] != self.archives:
+                raise ArchiveError(
+                    f"{self.checkpoint_path} belongs to an unfinished import of {', '.join(checkpoint['archives'])}, "
+                    "resume that import or pass --restart"
+                )
+
+        if checkpoint is None:
+
+            # one new batch for the whole import, so each imported week replaces what the store had
+            self.store.sync()
+            checkpoint = {
+                "batch": self.store.size, "file": 0, "position": 0, "line": 0, "store_size": self.store.size,
+                "rejects_size": 0, "elapsed": 0.0,
+                "stats": {"rows": 0, "matches": 0, "games": 0, "rejected": 0, "reasons": {}}
+            }
+            open(self.rejects_path, 'w').close()
+        else:
+            self.recover(checkpoint)
+
+        self.batch = checkpoint["batch"]
+        self.stats = checkpoint["stats"]
+        self.previous_elapsed = checkpoint["elapsed"]
+        self.resumed_rows = self.stats["rows"]
+        return checkpoint
+
+    def recover(self, checkpoint):
+
+        # whatever was appended after the last checkpoint belongs to the interrupted run, drop it
+        store_size = checkpoint["store_size"]
+        if self.store.size < store_size:
+            raise ArchiveError(f"{self.store.path} is shorter than when the import stopped, pass --restart")
+        if self.store.size > store_size:
+            for entry in self.store.entries_after(store_size):
+                if entry["batch"] != checkpoint["batch"]:
+                    raise ArchiveError(
+                        f"{self.store.path} was written to since the import stopped, pass --restart to import again"
+                    )
+            self.store.truncate(store_size)
+
+        if os.path.exists(self.rejects_path) and os.path.getsize(self.rejects_path) > checkpoint["rejects_size"]:
+            with open(self.rejects_path, 'r+b') as file:
+                file.truncate(checkpoint["rejects_size"])
+
+    def run(self, archives, week=None, restart=False):
+        checkpoint = self.start(archives, restart)
+        self.started = time.perf_counter()
+        self.rejects = open(self.rejects_path, 'a', encoding='utf-8')
+        try:
+            for file_num in range(checkpoint["file"], len(self.archives)):
+                path = self.archives[file_num]
+                position, line = (checkpoint["position"], checkpoint["line"]) if file_num == checkpoint["file"] else (0, 0)
+                self.import_file(file_num, path, position, line, week if week is not None else file_week(path))
+        finally:
+            self.rejects.close()
+
+        self.store.close()
+        os.remove(self.checkpoint_path)
+        return self.report()
+
+    def import_file(self, file_num, path, position, line, week):
+        reader = READERS[archive_format(path)]
+
+        # game rows of one match are consecutive, a match is complete once the key changes
+        group_key = None
+        rows = []
+        stats = self.stats
+        for start, start_line, record in reader(path, position, line, week):
+            if "games" in record or "error" in record:
+                key = start
+            else:
+                key = (record.get("week"), record.get("match") or (record.get("team1"), record.get("team2")))
+            if key != group_key:
+                if rows:
+                    self.finish(path, rows)
+                    rows = []
+                    if self.pending_count >= self.flush_matches:
+                        self.flush(file_num, start, start_line)
+                group_key = key
+            rows.append((start_line + 1, record))
+
+            stats["rows"] += 1
+            if self.on_progress and stats["rows"] % PROGRESS_ROWS == 0:
+                self.on_progress(self.report())
+
+        if rows:
+            self.finish(path, rows)
+        self.flush(file_num + 1, 0, 0)
+
+    def report(self):
+        elapsed = self.elapsed()
+        report = dict(self.stats)
+        report["elapsed"] = elapsed
+        report["rows_per_second"] = (self.stats["rows"] - self.resumed_rows) / max(elapsed - self.previous_elapsed, 1e-9)
+        report["rejects_file"] = self.rejects_path
+        return report
+
+
+def format_report(report):
+    line = (
+        f"{report['rows']} rows, {report['matches']} matches, {report['games']} games, "
+        f"{report['rejected']} rejected in {report['elapsed']:.1f}s ({report['rows_per_second']:.0f} rows/s)"
+    )
+    reasons = sorted(report["reasons"].items(), key=lambda item: item[1], reverse=True)
+    return "\n".join([line] + [f"  {count:8d} {reason}" for reason, count in reasons])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Import past results from CSV/JSONL archives or last_week_matches.json dumps into the season log. "
+                    "Imported weeks replace what the log had for those weeks."
+    )
+    parser.add_argument("archives", nargs="+", help="csv/tsv with a header row, jsonl, or json dumps")
+    parser.add_argument("--teams", default='teams.json')
+    parser.add_argument("--maps", default='maps.json')
+    parser.add_argument("--season", default='season_results.jsonl')
+    parser.add_argument("--week", type=int, help="week for rows that have none, last_week_matches*.json dumps otherwise take it from the file name")
+    parser.add_argument("--rejects", help="where rejected rows go, defaults next to the season log")
+    parser.add_argument("--restart", action="store_true", help="ignore an unfinished import and start over")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    def progress(report):
+        print(f"{report['rows']} rows, {report['rejected']} rejected, {report['rows_per_second']:.0f} rows/s", file=sys.stderr)
+
+    for path in args.archives:
+        archive_format(path)
+    importer = Importer(
+        SeasonStore(args.season), Catalog(args.teams, args.maps),
+        rejects_path=args.rejects, on_progress=None if args.quiet else progress
+    )
+    try:
+        report = importer.run(args.archives, args.week, args.restart)
+    except ArchiveError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except KeyboardInterrupt:
+        print("interrupted, run the same command again to resume", file=sys.stderr)
+        return 130
+
+    print(format_report(report))
+    if report["rejected"]:
+        print(f"rejected rows written to {report['rejects_file']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import json
+import math
+import time
+import tkinter as tk
+from tkinter import ttk
+from collections import deque
+from functools import wraps
+
+PROFILE_FILE = 'profile.json'
+
+# samples kept per span, counts and totals cover every call
+SAMPLE_LIMIT = 5000
+
+# how often the event-loop probe asks to run
+PROBE_INTERVAL = 100
+
+# the main methods of UTOWPocketCoordinator, wrapped before any widget captures them
+PROFILED_METHODS = (
+    "create_widgets", "refresh_match_lists", "render_matches", "create_match_row", "bind_match_row",
+    "on_teams_changed", "create_game_row", "increment_game", "decrement_game", "validate_teams",
+    "assign_teams", "show_conflicts", "generate_announcement", "copy_to_clipboard", "save_last_week_matches",
+    "load_standings", "plan_maps", "fill_round_robin", "fill_swiss", "fill_next_week",
+    "render_next_week_matches", "create_next_week_row", "bind_next_week_row", "store_next_week_match",
+    "plan_streams", "new_week", "autosave", "restore_last_session"
+)
+
+_active = None
+
+
+def percentile(samples, fraction):
+
+    # nearest rank on the sorted samples
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))]
+
+
+class Span:
+    __slots__ = ("count", "total", "own", "samples", "reads", "writes")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.own = 0.0
+        self.samples = deque(maxlen=SAMPLE_LIMIT)
+        self.reads = 0
+        self.writes = 0
+
+
+class Profiler:
+    def __init__(self):
+        self.spans = {}
+        self.lag = deque(maxlen=SAMPLE_LIMIT)
+        self.reads = 0
+        self.writes = 0
+
+        # [name, start, child time] for the spans currently running
+        self.stack = []
+
+    def span(self, name):
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span()
+        return span
+
+    def wrap(self, name, function):
+
+        # nested spans charge their time to the parent's total but not its own time
+        @wraps(function)
+        def timed(*args, **kwargs):
+            frame = [name, time.perf_counter(), 0.0]
+            self.stack.append(frame)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - frame[1]
+                self.stack.pop()
+                if self.stack:
+                    self.stack[-1][2] += elapsed
+                span = self.span(name)
+                span.count += 1
+                span.total += elapsed
+                span.own += elapsed - frame[2]
+                span.samples.append(elapsed)
+        return timed
+
+    def instrument(self, obj, names, prefix=""):
+
+        # shadow bound methods on the instance, so callers going through self.name are timed
+        for name in names:
+            function = getattr(obj, name, None)
+            if function is not None:
+                setattr(obj, name, self.wrap(prefix + name, function))
+
+    def count_variables(self):
+
+        # tk variable get/set are patched once per process, counts go to the active profiler
+        global _active
+        _active = self
+        install_variable_counters()
+
+    def count(self, writes):
+        span = self.span(self.stack[-1][0]) if self.stack else None
+        if writes:
+            self.writes += 1
+            if span:
+                span.writes += 1
+        else:
+            self.reads += 1
+            if span:
+                span.reads += 1
+
+    def reset(self):
+        self.spans = {}
+        self.lag.clear()
+        self.reads = 0
+        self.writes = 0
+
+    def report(self):
+        spans = {}
+        for name, span in self.spans.items():
+            spans[name] = {
+                "count": span.count,
+                "total_ms": span.total * 1000,
+                "self_ms": span.own * 1000,
+                "p50_ms": percentile(span.samples, 0.5) * 1000,
+                "p99_ms": percentile(span.samples, 0.99) * 1000,
+                "max_ms": max(span.samples, default=0.0) * 1000,
+                "var_reads": span.reads,
+                "var_writes": span.writes
+            }
+        return {
+            "spans": dict(sorted(spans.items(), key=lambda item: item[1]["self_ms"], reverse=True)),
+            "variables": {"reads": self.reads, "writes": self.writes},
+            "event_loop_lag": {
+                "samples": len(self.lag),
+                "p50_ms": percentile(self.lag, 0.5) * 1000,
+                "p99_ms": percentile(self.lag, 0.99) * 1000,
+                "max_ms": max(self.lag, default=0.0) * 1000
+            }
+        }
+
+    def format_report(self, limit=25):
+
+        # hot spots first: spans ordered by their own time
+        report = self.report()
+        lag = report["event_loop_lag"]
+        lines = [
+            f"event loop lag: p50 {lag['p50_ms']:.1f} ms, p99 {lag['p99_ms']:.1f} ms, "
+            f"max {lag['max_ms']:.1f} ms ({lag['samples']} samples)",
+            f"tk variables: {report['variables']['reads']} reads, {report['variables']['writes']} writes",
+            "",
+            f"{'span':32s} {'calls':>7s} {'self ms':>9s} {'total ms':>9s} {'p50':>7s} {'p99':>7s} {'reads':>7s} {'writes':>7s}"
+        ]
+        for name, span in list(report["spans"].items())[:limit]:
+            lines.append(
+                f"{name:32s} {span['count']:7d} {span['self_ms']:9.1f} {span['total_ms']:9.1f} "
+                f"{span['p50_ms']:7.2f} {span['p99_ms']:7.2f} {span['var_reads']:7d} {span['var_writes']:7d}"
+            )
+        return "\n".join(lines)
+
+    def export(self, path=PROFILE_FILE):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.report(), file, indent=2)
+
+
+def install_variable_counters():
+    if getattr(tk.Variable, "_counted", False):
+        return
+    tk.Variable._counted = True
+
+    def counted(function, writes):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active is not None:
+                _active.count(writes)
+            return function(*args, **kwargs)
+        return wrapper
+
+    # every subclass overrides get, set is only defined on Variable
+    tk.Variable.set = counted(tk.Variable.set, True)
+    for cls in (tk.Variable, tk.StringVar, tk.IntVar, tk.DoubleVar, tk.BooleanVar):
+        cls.get = counted(cls.__dict__["get"], False)
+
+
+class LagProbe:
+    def __init__(self, widget, profiler, interval=PROBE_INTERVAL):
+        self.widget = widget
+        self.profiler = profiler
+        self.interval = interval
+        self.expected = None
+        self.schedule()
+
+    def schedule(self):
+        self.expected = time.perf_counter() + self.interval / 1000
+        self.widget.after(self.interval, self.fire)
+
+    def fire(self):
+
+        # how late the loop got to us is how long it was busy with something else
+        self.profiler.lag.append(max(0.0, time.perf_counter() - self.expected))
+        self.schedule()
+
+
+class ProfilePanel(tk.Toplevel):
+    def __init__(self, master, profiler, export_path=PROFILE_FILE):
+        super().__init__(master)
+        self.title("Profile")
+        self.geometry("820x420")
+        self.profiler = profiler
+        self.export_path = export_path
+
+        self.text = tk.Text(self, wrap="none", font=("Courier", 9))
+        self.text.pack(fill="both", expand=True, padx=5, pady=5)
+
+        buttons = ttk.Frame(self)
+        buttons.pack(fill="x", padx=5, pady=(0, 5))
+        ttk.Button(buttons, text="Refresh", command=self.refresh).pack(side="left", padx=5)
+        ttk.Button(buttons, text="Reset", command=self.reset).pack(side="left", padx=5)
+        ttk.Button(buttons, text="Export", command=self.export).pack(side="left", padx=5)
+        self.status = ttk.Label(buttons, text="")
+        self.status.pack(side="right", padx=5)
+        self.refresh()
+
+    def refresh(self):
+
+        # building the report is not itself profiled, spans only cover the app
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, self.profiler.format_report())
+
+    def reset(self):
+        self.profiler.reset()
+        self.refresh()
+
+    def export(self):
+        self.profiler.export(self.export_path)
+        self.status.configure(text=f"Wrote {self.export_path}")
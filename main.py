@@ -1,16 +1,155 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, simpledialog
 import tkinter.font as tkfont
-import json
+import argparse
+import multiprocessing
 import os
+import queue
+import subprocess
+import sys
+import threading
 import datetime
-from utils import load_teams, load_maps
+from catalog import Catalog
+from announcement import AnnouncementError, MESSAGE_LIMIT, announcement_sections, pack_messages, split_sections
+from models import MIN_GAMES, MAX_GAMES, Week, add_game, new_matches, new_schedule, remove_game
+from virtual_list import VirtualList
+from season_store import SeasonStore, save_week
+from standings import Standings
+from scheduler import round_robin, swiss_round, byes_from_store
+from rotation import RotationPlanner, maps_played
+from autosave import AutosaveWriter, load_session, restore_session, snapshot_session
+from divisions import MANIFEST_FILE, Division, load_manifest, run_divisions
+from conflicts import BYE_SLOT, NEXT_WEEK, THIS_WEEK, AssignmentIndex
+from match_times import IntervalIndex, format_time, parse_time, upcoming_friday
+from instrumentation import PROFILE_FILE, PROFILED_METHODS, LagProbe, ProfilePanel, Profiler
+from search import NameIndex
+
+
+# keys that move around a dropdown rather than change what was typed
+NAVIGATION_KEYS = {
+    "Up", "Down", "Left", "Right", "Home", "End", "Return", "KP_Enter", "Tab", "Escape",
+    "Shift_L", "Shift_R", "Control_L", "Control_R", "Alt_L", "Alt_R"
+}
+
+
+def attach_typeahead(dropdown, index, committed, exclude=lambda: ()):
+
+    # index is a callable so the shared NameIndex is only built when a dropdown is used;
+    # the dropdown holds at most one page of suggestions, never the whole list
+    def suggest(query):
+        dropdown.configure(values=index().search(query, exclude=exclude(), keep=committed()))
+
+    def on_post():
+        text = dropdown.get()
+        suggest("" if text in index() else text)
+
+    def on_key(event):
+        if event.keysym not in NAVIGATION_KEYS:
+            suggest(dropdown.get())
+
+    def commit(event):
+
+        # take the exact name if it was typed, otherwise the first suggestion
+        text = dropdown.get()
+        value = index().resolve(text) if text else ""
+        if value is None:
+            suggestions = dropdown.cget("values")
+            value = suggestions[0] if suggestions else None
+        if value is None:
+            dropdown.set(committed())
+        else:
+            dropdown.set(value)
+            dropdown.event_generate("<<ComboboxSelected>>")
+
+    def on_focus_out(event):
+
+        # half-typed names fall back to whatever the model holds
+        text = dropdown.get()
+        value = index().resolve(text) if text else ""
+        if value is None:
+            dropdown.set(committed())
+        elif value != text:
+            dropdown.set(value)
+            dropdown.event_generate("<<ComboboxSelected>>")
+
+    dropdown.configure(postcommand=on_post)
+    dropdown.bind("<KeyRelease>", on_key, add="+")
+    dropdown.bind("<Return>", commit, add="+")
+    dropdown.bind("<KP_Enter>", commit, add="+")
+    dropdown.bind("<FocusOut>", on_focus_out, add="+")
+
+
+class GameRow:
+    def __init__(self, frame, game_num, map_index, on_change):
+        self.game = None
+        self.on_change = on_change
+        self.binding = False
+
+        # None for games past the last game mode, they have no maps to pick
+        self.map_index = map_index
+
+        self.map_label = ttk.Label(frame, text=f"Game {game_num} Map:")
+        self.map_label.grid(row=2 + game_num, column=0, padx=5, pady=2, sticky="e")
+        self.map_var = tk.StringVar()
+        self.map_dropdown = ttk.Combobox(frame, textvariable=self.map_var, width=25)
+        self.map_dropdown.grid(row=2 + game_num, column=1, padx=5, pady=2, sticky="w")
+        if map_index is not None:
+            attach_typeahead(self.map_dropdown, map_index, lambda: self.game.map if self.game else "")
+        else:
+            self.map_dropdown.configure(state="disabled")
+
+        self.winner_label = ttk.Label(frame, text="Winner:")
+        self.winner_label.grid(row=2 + game_num, column=2, padx=5, pady=2, sticky="e")
+        self.winner_var = tk.StringVar()
+        self.winner_dropdown = ttk.Combobox(
+            frame, values=["Draw"], textvariable=self.winner_var, state="readonly", width=25
+        )
+        self.winner_dropdown.grid(row=2 + game_num, column=3, padx=5, pady=2, sticky="w")
+
+        self.widgets = (self.map_label, self.map_dropdown, self.winner_label, self.winner_dropdown)
+
+        # write map/winner changes back to the bound game
+        self.map_var.trace_add("write", self.store)
+        self.winner_var.trace_add("write", self.store)
+
+    def show(self, game, team1, team2):
+        self.binding = True
+        self.game = game
+        self.map_var.set(game.map)
+        self.winner_var.set(game.winner)
+        self.winner_dropdown["values"] = ["Draw", team1, team2]
+        for widget in self.widgets:
+            widget.grid()
+        self.binding = False
+
+    def hide(self):
+        self.game = None
+        for widget in self.widgets:
+            widget.grid_remove()
+
+    def set_winner_options(self, winner_options):
+        self.winner_var.set('')
+        self.winner_dropdown["values"] = winner_options
+
+    def store(self, *args):
+        if self.binding or self.game is None:
+            return
+
+        # typed text only becomes the map once it names one
+        map_name = self.map_var.get()
+        if not map_name or (self.map_index is not None and map_name in self.map_index()):
+            self.game.map = map_name
+        self.game.winner = self.winner_var.get()
+        self.on_change()
 
 
 class UTOWPocketCoordinator(tk.Tk):
-    def __init__(self):
+    def __init__(self, division=None):
         super().__init__()
-        self.title("UTOW Pocket Coordinator")
+
+        # without a manifest the division is just the working directory
+        self.division = division or Division("")
+        self.title(f"UTOW Pocket Coordinator - {self.division.name}" if self.division.name else "UTOW Pocket Coordinator")
         self.geometry("600x800")
         self.minsize(600, 800)
 
@@ -23,10 +162,11 @@ class UTOWPocketCoordinator(tk.Tk):
         self.style.configure("TCombobox", font=self.custom_font)
         self.style.configure("TEntry", font=self.custom_font)
         self.style.configure("Header.TLabelframe.Label", foreground="#b54882", font=self.custom_font)
+        self.style.configure("Conflict.TLabelframe.Label", foreground="#d62828", font=self.custom_font)
 
-        # load teams + maps
-        self.teams = load_teams()
-        self.maps = load_maps()
+        # load teams, maps are loaded on first use
+        self.catalog = Catalog(self.division.teams, self.division.maps)
+        self.teams = self.catalog.teams
 
         # find match number
         self.num_teams = len(self.teams)
@@ -34,20 +174,84 @@ class UTOWPocketCoordinator(tk.Tk):
 
         # handle bye team
         if self.num_teams % 2 == 1:
-            self.bye_team = tk.StringVar()
+            self.bye_team = ""
         else:
             self.bye_team = None
 
         # define game mode order
         self.game_mode_order = ["control", "hybrid", "flashpoint", "push", "escort", "clash"]
-        self.last_week_file = 'last_week_matches.json'
-        self.next_week_match_widgets = []
+        self.last_week_file = self.division.last_week
+
+        # season history, regenerating within a session replaces the same week
+        self.season_store = SeasonStore(self.division.season)
+        self.week_number = self.season_store.next_week()
+
+        # built from the season store the first time they are needed
+        self.standings = None
+        self.season_schedule = None
+        self.rotation = None
+
+        # match state lives here, widgets only display it
+        self.matches = []
+        self.next_week_matches = []
+
+        # team -> slots across both weeks, updated one selection at a time
+        self.assignments = AssignmentIndex()
+
+        # one typeahead index per name list, shared by every dropdown and built on first use
+        self._team_search = None
+        self.map_search = {}
+
+        # count team-change callbacks, shown with UTOW_DEBUG=1
+        self.debug = bool(os.environ.get("UTOW_DEBUG"))
+        self.team_callbacks = 0
+
+        # last generated announcement, copied one message at a time
+        self.announcement = ""
+        self.announcement_sections = []
+        self.copied_messages = []
+        self.message_index = 0
 
         # define header color
         self.header_color = "#b54882"
 
+        # autosave the whole form on a background writer
+        self.autosave_writer = AutosaveWriter(self.division.session)
+        self.autosave_pending = False
+
+        # opt-in timing spans, UTOW_PROFILE=1 or UTOW_PROFILE=path.json; ctrl+shift+p shows the panel
+        self.profiler = None
+        profile = os.environ.get("UTOW_PROFILE")
+        if profile:
+            self.profile_file = profile if profile.endswith(".json") else PROFILE_FILE
+            self.profiler = Profiler()
+            self.profiler.instrument(self, PROFILED_METHODS)
+            self.profiler.count_variables()
+
         # create ui
         self.create_widgets()
+        self.restore_last_session()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        if self.profiler:
+            self.start_profiling()
+
+    @property
+    def maps(self):
+        return self.catalog.maps
+
+    @property
+    def team_search(self):
+        if self._team_search is None:
+            self._team_search = NameIndex(self.teams)
+        return self._team_search
+
+    def map_index(self, game_mode):
+
+        # matched on display names, so "busan" finds ":flag_kr: __Busan__"
+        if game_mode not in self.map_search:
+            self.map_search[game_mode] = NameIndex.from_pairs(self.catalog.map_entries.get(game_mode, []))
+        return self.map_search[game_mode]
 
     def create_widgets(self):
 
@@ -69,7 +273,8 @@ class UTOWPocketCoordinator(tk.Tk):
         )
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        canvas.configure(yscrollcommand=lambda first, last: self.on_scroll(scrollbar, first, last))
+        canvas.bind("<Configure>", lambda e: self.refresh_match_lists())
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -78,14 +283,55 @@ class UTOWPocketCoordinator(tk.Tk):
         self.matches_frame = ttk.LabelFrame(scrollable_frame, text="Matches This Week", style="Header.TLabelframe")
         self.matches_frame.pack(fill="x", padx=10, pady=10)
 
-        self.match_widgets = []
+        plan_maps_btn = ttk.Button(self.matches_frame, text="Plan Maps", command=self.plan_maps)
+        plan_maps_btn.pack(anchor="w", padx=10, pady=5)
+
+        # only matches on screen get widgets, rows are recycled while scrolling
+        self.match_list = VirtualList(
+            canvas, self.matches_frame, self.create_match_row, self.bind_match_row,
+            height_key=lambda match: len(match.games)
+        )
         self.render_matches()
 
         # matches next week frame
         self.next_week_frame = ttk.LabelFrame(scrollable_frame, text="Matches Next Week", style="Header.TLabelframe")
         self.next_week_frame.pack(fill="x", padx=10, pady=10)
 
-        self.next_week_match_widgets = []
+        # pre-fill pairings from a schedule
+        schedule_frame = ttk.Frame(self.next_week_frame)
+        schedule_frame.pack(fill="x", padx=5, pady=5)
+
+        round_robin_btn = ttk.Button(schedule_frame, text="Fill Round Robin", command=self.fill_round_robin)
+        round_robin_btn.pack(side="left", padx=5)
+
+        swiss_btn = ttk.Button(schedule_frame, text="Fill Swiss", command=self.fill_swiss)
+        swiss_btn.pack(side="left", padx=5)
+
+        streams_btn = ttk.Button(schedule_frame, text="Plan Streams", command=self.plan_streams)
+        streams_btn.pack(side="left", padx=5)
+
+        # odd leagues: who sits out next week, filled by the schedulers and editable by hand
+        if self.bye_team is not None:
+            bye_frame = ttk.Frame(self.next_week_frame)
+            bye_frame.pack(fill="x", padx=5, pady=5)
+
+            ttk.Label(bye_frame, text="Bye:").pack(side="left", padx=5)
+            self.bye_var = tk.StringVar()
+            self.bye_dropdown = ttk.Combobox(bye_frame, textvariable=self.bye_var, width=25)
+            self.bye_dropdown.pack(side="left", padx=5)
+            self.bye_label = ttk.Label(bye_frame, text="")
+            self.bye_label.pack(side="left", padx=5)
+
+            self.bye_binding = False
+            self.bye_var.trace_add("write", lambda *args: self.store_bye())
+            attach_typeahead(
+                self.bye_dropdown, lambda: self.team_search, lambda: self.bye_team,
+                lambda: self.assignments.assigned(NEXT_WEEK)
+            )
+
+        self.next_week_list = VirtualList(
+            canvas, self.next_week_frame, self.create_next_week_row, self.bind_next_week_row, estimate=90
+        )
         self.render_next_week_matches()
 
         # announcement frame
@@ -107,166 +353,189 @@ class UTOWPocketCoordinator(tk.Tk):
         copy_btn = ttk.Button(buttons_frame, text="Copy to Clipboard", command=self.copy_to_clipboard)
         copy_btn.pack(side="left", padx=5)
 
-    def render_matches(self):
+        new_week_btn = ttk.Button(buttons_frame, text="New Week", command=self.new_week)
+        new_week_btn.pack(side="left", padx=5)
 
-        # clean widgets
-        for widget in self.match_widgets:
-            widget["frame"].destroy()
-        self.match_widgets.clear()
+        self.include_standings = tk.BooleanVar(value=False)
+        standings_check = ttk.Checkbutton(buttons_frame, text="Include Standings", variable=self.include_standings)
+        standings_check.pack(side="left", padx=5)
 
-        for match_num in range(1, self.num_matches + 1):
-            frame = ttk.LabelFrame(self.matches_frame, text=f"Match {match_num}", style="Header.TLabelframe")
-            frame.pack(fill="x", padx=5, pady=5)
+        if self.debug:
+            self.callbacks_label = ttk.Label(buttons_frame, text="")
+            self.callbacks_label.pack(side="right", padx=5)
 
-            # teams selection
-            ttk.Label(frame, text="Team 1:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-            team1_var = tk.StringVar()
-            team1_dropdown = ttk.Combobox(
-                frame, values=self.teams, textvariable=team1_var, state="readonly", width=25
-            )
-            team1_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="w")
-            team1_dropdown.set('')
+    def on_scroll(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        self.refresh_match_lists()
 
-            ttk.Label(frame, text="Team 2:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
-            team2_var = tk.StringVar()
-            team2_dropdown = ttk.Combobox(
-                frame, values=self.teams, textvariable=team2_var, state="readonly", width=25
-            )
-            team2_dropdown.grid(row=0, column=3, padx=5, pady=5, sticky="w")
-            team2_dropdown.set('')
+    def refresh_match_lists(self):
+        self.match_list.refresh()
+        self.next_week_list.refresh()
 
-            # prevent same team selection
-            team1_dropdown.bind(
-                "<<ComboboxSelected>>",
-                lambda event, t2_dropdown=team2_dropdown: self.validate_teams(event, t2_dropdown)
-            )
-            team2_dropdown.bind(
-                "<<ComboboxSelected>>",
-                lambda event, t1_dropdown=team1_dropdown: self.validate_teams(event, t1_dropdown)
-            )
-
-            # number of games within match
-            ttk.Label(frame, text="Number of Games:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-            games_control_frame = ttk.Frame(frame)
-            games_control_frame.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+    def render_matches(self):
+        self.matches = new_matches(self.num_matches)
+        self.assignments.load(THIS_WEEK, self.matches)
+        self.match_list.set_items(self.matches)
+
+    def create_match_row(self, parent):
+        frame = ttk.LabelFrame(parent, style="Header.TLabelframe")
+
+        # teams selection
+        ttk.Label(frame, text="Team 1:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        team1_var = tk.StringVar()
+        team1_dropdown = ttk.Combobox(
+            frame, textvariable=team1_var, width=25
+        )
+        team1_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
-            decrease_game_btn = ttk.Button(
-                games_control_frame, text="-",
-                command=lambda m=match_num: self.decrement_game(m)
-            )
+        ttk.Label(frame, text="Team 2:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
+        team2_var = tk.StringVar()
+        team2_dropdown = ttk.Combobox(
+            frame, textvariable=team2_var, width=25
+        )
+        team2_dropdown.grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
-            decrease_game_btn.pack(side="left")
-            game_var = tk.IntVar(value=3)  # default: 3
-            game_label = ttk.Label(games_control_frame, textvariable=game_var)
-            game_label.pack(side="left", padx=5)
+        # prevent same team selection
+        team1_dropdown.bind(
+            "<<ComboboxSelected>>",
+            lambda event, t2_dropdown=team2_dropdown: self.validate_teams(event, t2_dropdown)
+        )
+        team2_dropdown.bind(
+            "<<ComboboxSelected>>",
+            lambda event, t1_dropdown=team1_dropdown: self.validate_teams(event, t1_dropdown)
+        )
 
-            increase_game_btn = ttk.Button(
-                games_control_frame, text="+",
-                command=lambda m=match_num: self.increment_game(m)
-            )
+        # number of games within match
+        ttk.Label(frame, text="Number of Games:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
+        games_control_frame = ttk.Frame(frame)
+        games_control_frame.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+
+        # store references
+        row = {
+            "frame": frame,
+            "team1": team1_var,
+            "team2": team2_var,
+            "team1_dropdown": team1_dropdown,
+            "team2_dropdown": team2_dropdown,
+            "games": tk.IntVar(),
+            "game_rows": [],
+            "match": None,
+            "binding": False
+        }
 
-            increase_game_btn.pack(side="left")
+        decrease_game_btn = ttk.Button(
+            games_control_frame, text="-",
+            command=lambda r=row: self.decrement_game(r["match"].number)
+        )
 
-            # store references
-            match_info = {
-                "frame": frame,
-                "team1": team1_var,
-                "team2": team2_var,
-                "games": game_var,
-                "game_widgets": []
-            }
-            self.match_widgets.append(match_info)
+        decrease_game_btn.pack(side="left")
+        game_label = ttk.Label(games_control_frame, textvariable=row["games"])
+        game_label.pack(side="left", padx=5)
 
-            # maps and winners for each game
-            for game_num in range(1, game_var.get() + 1):
-                self.create_game_widgets(frame, match_info, game_num)
+        increase_game_btn = ttk.Button(
+            games_control_frame, text="+",
+            command=lambda r=row: self.increment_game(r["match"].number)
+        )
 
-    def create_game_widgets(self, frame, match_info, game_num):
-        ttk.Label(frame, text=f"Game {game_num} Map:").grid(row=2 + game_num, column=0, padx=5, pady=2, sticky="e")
-        map_var = tk.StringVar()
+        increase_game_btn.pack(side="left")
+
+        # one handler per match updates the model and every winner dropdown
+        team1_var.trace_add("write", lambda *args, r=row: self.on_teams_changed(r))
+        team2_var.trace_add("write", lambda *args, r=row: self.on_teams_changed(r))
+        self.attach_team_typeahead(THIS_WEEK, row)
+
+        return row
+
+    def bind_match_row(self, row, match):
+        row["binding"] = True
+        row["match"] = match
+        row["frame"].configure(text=match.label)
+        row["team1"].set(match.team1)
+        row["team2"].set(match.team2)
+        row["games"].set(len(match.games))
+
+        # pooled rows keep their game rows, extra ones are hidden
+        while len(row["game_rows"]) < len(match.games):
+            self.create_game_row(row)
+
+        for game_row, game in zip(row["game_rows"], match.games):
+            game_row.show(game, match.team1, match.team2)
+        for game_row in row["game_rows"][len(match.games):]:
+            game_row.hide()
+
+        self.show_conflicts(row, THIS_WEEK)
+        row["binding"] = False
+
+    def on_teams_changed(self, row):
+        if row["binding"]:
+            return
+        self.team_callbacks += 1
+
+        match = row["match"]
+        team1 = self.typed_team(row, "team1")
+        team2 = self.typed_team(row, "team2")
+        if (team1, team2) == (match.team1, match.team2):
+            return
+        match.team1 = team1
+        match.team2 = team2
+        self.assign_teams(THIS_WEEK, match)
+
+        # reset every game's winner in a single pass
+        winner_options = ["Draw", match.team1, match.team2]
+        for game_row in row["game_rows"][:len(match.games)]:
+            game_row.set_winner_options(winner_options)
+        self.mark_dirty()
+
+    def create_game_row(self, row):
+        game_num = len(row["game_rows"]) + 1
 
         # calculate game mode based on game number
         if 1 <= game_num <= 6:
             game_mode = self.game_mode_order[game_num - 1]
-            available_maps = self.maps.get(game_mode, [])
+            map_index = lambda: self.map_index(game_mode)
         else:
-            available_maps = []
-
-        map_dropdown = ttk.Combobox(
-            frame, values=available_maps, textvariable=map_var, state="readonly", width=25
-        )
-
-        map_dropdown.grid(row=2 + game_num, column=1, padx=5, pady=2, sticky="w")
-        map_dropdown.set('')
-
-        ttk.Label(frame, text="Winner:").grid(row=2 + game_num, column=2, padx=5, pady=2, sticky="e")
-        winner_var = tk.StringVar()
-
-        # initialize winner options
-        winner_options = ["Draw", match_info["team1"].get(), match_info["team2"].get()]
-        winner_dropdown = ttk.Combobox(
-            frame, values=winner_options, textvariable=winner_var, state="readonly", width=25
-        )
-        winner_dropdown.grid(row=2 + game_num, column=3, padx=5, pady=2, sticky="w")
-        winner_dropdown.set('')
-
-        # update winner options (when team(s) change)
-        match_info["team1"].trace_add("write", lambda *args, m=match_info, g=game_num: self.update_winner_options(m, g))
-        match_info["team2"].trace_add("write", lambda *args, m=match_info, g=game_num: self.update_winner_options(m, g))
+            map_index = None
 
-        game_widget = {
-            "map": map_var,
-            "winner": winner_var,
-            "winner_dropdown": winner_dropdown
-        }
-        match_info["game_widgets"].append(game_widget)
+        game_row = GameRow(row["frame"], game_num, map_index, self.mark_dirty)
+        row["game_rows"].append(game_row)
+        return game_row
 
     def increment_game(self, match_num):
+        match = self.matches[match_num - 1]
+        game = add_game(match)
+
+        if game is not None:
+
+            # only the new game row changes, and only if the match is on screen
+            row = self.match_list.row_for(match_num - 1)
+            if row:
+                game_num = len(match.games)
+                if len(row["game_rows"]) < game_num:
+                    self.create_game_row(row)
+                row["game_rows"][game_num - 1].show(game, match.team1, match.team2)
+                row["games"].set(game_num)
+            self.match_list.resize(match_num - 1)
+            self.mark_dirty()
 
-        for widget in self.match_widgets:
-            if widget["frame"].cget("text") == f"Match {match_num}":
-
-                if widget["games"].get() < 6:
-                    widget["games"].set(widget["games"].get() + 1)
-                    new_game_num = widget["games"].get()
-                    self.create_game_widgets(widget["frame"], widget, new_game_num)
-
-                else:
-                    messagebox.showwarning("Maximum Games", "Cannot have more than 6 games.")
-
-                break
+        else:
+            messagebox.showwarning("Maximum Games", f"Cannot have more than {MAX_GAMES} games.")
 
     def decrement_game(self, match_num):
+        match = self.matches[match_num - 1]
 
-        for widget in self.match_widgets:
+        if remove_game(match):
+            row = self.match_list.row_for(match_num - 1)
+            if row:
+                row["game_rows"][len(match.games)].hide()
+                row["games"].set(len(match.games))
+            self.match_list.resize(match_num - 1)
+            self.mark_dirty()
 
-            if widget["frame"].cget("text") == f"Match {match_num}":
-                if widget["games"].get() > 3:
-                    last_game_num = widget["games"].get()
-
-                    # remove last game widget
-                    for col in range(4):
-                        slaves = widget["frame"].grid_slaves(row=2 + last_game_num, column=col)
-                        if slaves:
-                            slaves[0].destroy()
-                    widget["game_widgets"].pop()
-                    widget["games"].set(widget["games"].get() - 1)
-
-                else:
-                    messagebox.showwarning("Minimum Games", "Cannot have less than 3 games.")
-
-                break
-
-    def update_winner_options(self, match_info, game_num):
-
-        team1 = match_info["team1"].get()
-        team2 = match_info["team2"].get()
-        if game_num - 1 < len(match_info["game_widgets"]):
-            game_widget = match_info["game_widgets"][game_num - 1]
-            game_widget["winner"].set('')
-            game_widget["winner_dropdown"]["values"] = ["Draw", team1, team2]
+        else:
+            messagebox.showwarning("Minimum Games", f"Cannot have less than {MIN_GAMES} games.")
 
     def validate_teams(self, event, other_dropdown):
+        self.show_team_callbacks()
 
         selected_team = event.widget.get()
         other_selected = other_dropdown.get()
@@ -275,132 +544,80 @@ class UTOWPocketCoordinator(tk.Tk):
             messagebox.showerror("Invalid Selection", "Both teams in a match must be different.")
             event.widget.set('')
 
+    def attach_team_typeahead(self, scope, row):
+
+        # suggestions leave out teams already playing that week, except the dropdown's own pick
+        for dropdown, side in ((row["team1_dropdown"], "team1"), (row["team2_dropdown"], "team2")):
+            attach_typeahead(
+                dropdown, lambda: self.team_search,
+                lambda r=row, side=side: getattr(r["match"], side) if r["match"] else "",
+                lambda: self.assignments.assigned(scope)
+            )
+
+    def typed_team(self, row, side):
+
+        # a half-typed name leaves the model alone until it names a team
+        team = row[side].get()
+        if not team or team in self.team_search:
+            return team
+        return getattr(row["match"], side)
+
+    def assign_teams(self, scope, match):
+
+        # only the two slots of this match change, so only rows sharing those teams are restyled
+        match_index = match.number - 1
+        affected = self.assignments.assign(scope, (match_index, 1), match.team1)
+        affected |= self.assignments.assign(scope, (match_index, 2), match.team2)
+        self.flag_conflicts(scope, affected)
+
+    def flag_conflicts(self, scope, slots):
+        match_list = self.match_list if scope == THIS_WEEK else self.next_week_list
+        for slot in slots:
+            if slot == BYE_SLOT:
+                self.show_bye_conflict()
+                continue
+            row = match_list.row_for(slot[0])
+            if row:
+                self.show_conflicts(row, scope)
+
+    def show_conflicts(self, row, scope):
+        match = row["match"]
+        conflicts = [
+            self.assignments.describe(scope, team)
+            for team in dict.fromkeys((match.team1, match.team2))
+            if team and self.assignments.is_conflict(scope, team)
+        ]
+        if conflicts:
+            row["frame"].configure(text=f"{match.label} - {'; '.join(conflicts)}", style="Conflict.TLabelframe")
+        else:
+            row["frame"].configure(text=match.label, style="Header.TLabelframe")
+
+    def show_team_callbacks(self):
+
+        # callbacks fired since the previous team selection
+        if self.debug:
+            self.callbacks_label.configure(text=f"Callbacks per selection: {self.team_callbacks}")
+        self.team_callbacks = 0
+
     def generate_announcement(self):
         try:
-            last_week_data = []
-            for widget in self.match_widgets:
-                team1 = widget["team1"].get()
-                team2 = widget["team2"].get()
-
-                # ensure teams are different and not blank
-                if not team1 or not team2:
-                    messagebox.showerror(
-                        "Incomplete Selection",
-                        f"In {widget['frame'].cget('text')}, both teams must be selected."
-                    )
-                    return
-
-                if team1 == team2:
-                    messagebox.showerror(
-                        "Invalid Teams",
-                        f"In {widget['frame'].cget('text')}, both teams are the same."
-                    )
-                    return
-
-                match_entry = {
-                    "team1": team1,
-                    "team2": team2,
-                    "games": [],
-                    "overall_winner": ""
-                }
-
-                team1_wins = 0
-                team2_wins = 0
-
-                for game in widget["game_widgets"]:
-                    map_name = game["map"].get()
-                    winner = game["winner"].get()
-
-                    # ensure map/winner selected
-                    if not map_name or not winner:
-                        messagebox.showerror(
-                            "Incomplete Selection",
-                            f"In {widget['frame'].cget('text')}, all games must have a map and a winner selected."
-                        )
-                        return
-
-                    match_entry["games"].append({"map": map_name, "winner": winner})
-
-                    if winner == team1:
-                        team1_wins += 1
-
-                    elif winner == team2:
-                        team2_wins += 1
-
-                if team1_wins > team2_wins:
-                    match_entry["overall_winner"] = team1
-
-                elif team2_wins > team1_wins:
-                    match_entry["overall_winner"] = team2
-
-                else:
-                    match_entry["overall_winner"] = "Draw"
-
-                last_week_data.append(match_entry)
-
-            # generate announcement
-            announcement = "@Intramurals\n\n"
-            announcement += "once again, we're looking to **stream** some games this week.\n"
-            announcement += "please schedule your games asap in #match-chats so we can plan to stream them <3\n\n"
-            announcement += "**────────────**\n\n"
-
-            # MATCHES LAST WEEK
-            announcement += ":hibiscus: **MATCHES LAST WEEK**\n\n"
-            for match in last_week_data:
-                team1 = match["team1"]
-                team2 = match["team2"]
-                winner = match["overall_winner"]
-                if winner != "Draw":
-                    winner_text = f"{winner} WIN"
-                else:
-                    winner_text = "DRAW"
-
-                match_line = f":coconut:{team1} vs. :coconut:{team2}: {winner_text}\n"
-
-                for game in match["games"]:
-                    map_name = game["map"]
-                    game_winner = game["winner"]
-                    match_line += f"{map_name}: {game_winner}\n"
-                match_line += "\n"
-                announcement += match_line
-
-            if self.bye_team and self.bye_team.get():
-                announcement += f"**────────────**\n\n"
-                announcement += f"**Bye:** {self.bye_team.get()} has a bye this week.\n\n"
-
-            # MATCHES THIS WEEK
-            announcement += "**────────────**\n\n"
-            announcement += ":palm_tree: **MATCHES __THIS__ WEEK**\n\n"
-
-            for match in self.next_week_match_widgets:
-                team1 = match["team1"].get()
-                team2 = match["team2"].get()
-                datetime_str = match["datetime"].get()
-                scheduled = match["scheduled"].get()
-
-                # ensure teams are selected and different
-                if not team1 or not team2:
-                    messagebox.showerror(
-                        "Incomplete Selection",
-                        f"In Next Week {match['frame'].cget('text')}, both teams must be selected."
-                    )
-                    return
-
-                if team1 == team2:
-                    messagebox.showerror(
-                        "Invalid Teams",
-                        f"In Next Week {match['frame'].cget('text')}, both teams are the same."
-                    )
-                    return
-
-                match_line = f"@{team1} vs. @{team2}"
-                if scheduled:
-                    match_line += " ✅️"
-                match_line += f"\n[{datetime_str}]"
-
-                announcement += f"{match_line}\n\n"
-
-            announcement += "**────────────**\n"
+            week = Week(self.matches, self.next_week_matches, self.bye_team)
+
+            standings = None
+            if self.include_standings.get():
+                standings = self.load_standings()
+
+            try:
+                sections, last_week_data = announcement_sections(week, standings, self.week_number)
+            except AnnouncementError as e:
+                messagebox.showerror(e.title, e.message)
+                return
+            announcement = "".join(block for section in sections for block in section)
+
+            # sections let copy split messages between match blocks
+            self.announcement_sections = sections
+            self.announcement = announcement
+            self.copied_messages = []
 
             # display announcement
             self.announcement_text.delete("1.0", tk.END)
@@ -417,94 +634,514 @@ class UTOWPocketCoordinator(tk.Tk):
         announcement = self.announcement_text.get("1.0", tk.END).strip()
 
         if announcement:
+
+            # fall back to paragraphs if the text was edited after generating
+            if announcement == self.announcement.strip():
+                messages = pack_messages(self.announcement_sections, MESSAGE_LIMIT)
+            else:
+                messages = pack_messages(split_sections(announcement), MESSAGE_LIMIT)
+
+            if len(messages) == 1:
+                message = messages[0]
+                info = "Copied to clipboard!"
+            else:
+
+                # one discord-sized message per click
+                if messages != self.copied_messages:
+                    self.copied_messages = messages
+                    self.message_index = 0
+                message = messages[self.message_index]
+                info = f"Copied message {self.message_index + 1} of {len(messages)} to clipboard!"
+                self.message_index = (self.message_index + 1) % len(messages)
+
             self.clipboard_clear()
-            self.clipboard_append(announcement)
+            self.clipboard_append(message)
             self.update()
-            messagebox.showinfo("Copied", "Copied to clipboard!")
+            messagebox.showinfo("Copied", info)
 
         else:
             messagebox.showwarning("No Content", "There is no announcement to copy.")
 
     def save_last_week_matches(self, data):
         try:
-            with open(self.last_week_file, 'w') as file:
-                json.dump(data, file, indent=4)
+            save_week(self.season_store, self.week_number, data, self.last_week_file)
+
+            # re-applying the latest week replaces it, so this is safe after generate
+            if self.standings is not None:
+                self.standings.apply_week(self.week_number, data)
+
+            # map usage is rebuilt from the store next time maps are planned
+            self.rotation = None
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save last week's matches: {e}")
 
+    def load_standings(self):
+        if self.standings is None:
+            self.standings = Standings.from_store(self.season_store, self.teams)
+        return self.standings
+
+    def plan_maps(self):
+        if self.rotation is None:
+            self.rotation = RotationPlanner.from_store(self.season_store, self.maps, self.game_mode_order)
+
+        # avoid maps either team played last week, keep maps already picked
+        recent_maps = maps_played(self.season_store.week_results(self.week_number - 1))
+        plan = self.rotation.plan_week(
+            [(match.team1, match.team2, len(match.games)) for match in self.matches], recent_maps
+        )
+        for match, series in zip(self.matches, plan):
+            for game, map_name in zip(match.games, series):
+                if not game.map:
+                    game.map = map_name
+
+        self.match_list.set_items(self.matches)
+        self.mark_dirty()
+
+    def fill_round_robin(self):
+        if self.season_schedule is None:
+            self.season_schedule = round_robin(self.teams)
+        if not self.season_schedule:
+            return
+
+        # this week's results are round week_number, next week plays the one after
+        next_round = self.season_schedule[self.week_number % len(self.season_schedule)]
+        self.fill_next_week(next_round.pairs, next_round.bye)
+
+    def fill_swiss(self):
+        byes = byes_from_store(self.season_store, self.teams)
+        pairs, bye = swiss_round(self.teams, self.load_standings(), byes)
+        self.fill_next_week(pairs, bye)
+
+    def fill_next_week(self, pairs, bye):
+        for match, (team1, team2) in zip(self.next_week_matches, pairs):
+            match.team1 = team1
+            match.team2 = team2
+        if self.bye_team is not None:
+            self.bye_team = bye or ""
+        self.assignments.load(NEXT_WEEK, self.next_week_matches, self.bye_team)
+
+        # rebind the rows on screen, the rest pick it up when scrolled to
+        self.next_week_list.set_items(self.next_week_matches)
+        self.show_bye()
+        self.mark_dirty()
+
+    def show_bye(self):
+        if self.bye_team is None:
+            return
+        self.bye_binding = True
+        self.bye_var.set(self.bye_team)
+        self.bye_binding = False
+        self.show_bye_conflict()
+
+    def store_bye(self):
+        if self.bye_binding:
+            return
+
+        # a half-typed name leaves the model alone until it names a team
+        team = self.bye_var.get()
+        if team and team not in self.team_search:
+            return
+        self.bye_team = team
+        self.flag_conflicts(NEXT_WEEK, self.assignments.assign(NEXT_WEEK, BYE_SLOT, team))
+        self.mark_dirty()
+
+    def show_bye_conflict(self):
+        if self.bye_team and self.assignments.is_conflict(NEXT_WEEK, self.bye_team):
+            self.bye_label.configure(text=self.assignments.describe(NEXT_WEEK, self.bye_team), foreground="#d62828")
+        else:
+            self.bye_label.configure(text="", foreground="")
+
     def render_next_week_matches(self):
 
-        # clean widgets
-        for widget in self.next_week_match_widgets:
-            widget["frame"].destroy()
-        self.next_week_match_widgets.clear()
+        # default every match to the upcoming friday at 8pm eastern
+        self.week_start = upcoming_friday()
+        self.next_week_matches = new_schedule(self.num_matches, self.week_start)
+        self.assignments.load(NEXT_WEEK, self.next_week_matches)
+        self.next_week_list.set_items(self.next_week_matches)
 
-        for match_num in range(1, self.num_matches + 1):
-            frame = ttk.LabelFrame(self.next_week_frame, text=f"Match {match_num}", style="Header.TLabelframe")
-            frame.pack(fill="x", padx=5, pady=5)
+    def create_next_week_row(self, parent):
+        frame = ttk.LabelFrame(parent, style="Header.TLabelframe")
 
-            # teams selection
-            ttk.Label(frame, text="Team 1:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
-            team1_var = tk.StringVar()
-            team1_dropdown = ttk.Combobox(
-                frame, values=self.teams, textvariable=team1_var, state="readonly", width=25
-            )
-            team1_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="w")
-            team1_dropdown.set('')
+        # teams selection
+        ttk.Label(frame, text="Team 1:").grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        team1_var = tk.StringVar()
+        team1_dropdown = ttk.Combobox(
+            frame, textvariable=team1_var, width=25
+        )
+        team1_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="w")
 
-            ttk.Label(frame, text="Team 2:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
-            team2_var = tk.StringVar()
-            team2_dropdown = ttk.Combobox(
-                frame, values=self.teams, textvariable=team2_var, state="readonly", width=25
-            )
-            team2_dropdown.grid(row=0, column=3, padx=5, pady=5, sticky="w")
-            team2_dropdown.set('')
+        ttk.Label(frame, text="Team 2:").grid(row=0, column=2, padx=5, pady=5, sticky="e")
+        team2_var = tk.StringVar()
+        team2_dropdown = ttk.Combobox(
+            frame, textvariable=team2_var, width=25
+        )
+        team2_dropdown.grid(row=0, column=3, padx=5, pady=5, sticky="w")
 
-            # prevent same team selection
-            team1_dropdown.bind(
-                "<<ComboboxSelected>>",
-                lambda event, t2_dropdown=team2_dropdown: self.validate_teams(event, t2_dropdown)
-            )
-            team2_dropdown.bind(
-                "<<ComboboxSelected>>",
-                lambda event, t1_dropdown=team1_dropdown: self.validate_teams(event, t1_dropdown)
-            )
+        # prevent same team selection
+        team1_dropdown.bind(
+            "<<ComboboxSelected>>",
+            lambda event, t2_dropdown=team2_dropdown: self.validate_teams(event, t2_dropdown)
+        )
+        team2_dropdown.bind(
+            "<<ComboboxSelected>>",
+            lambda event, t1_dropdown=team1_dropdown: self.validate_teams(event, t1_dropdown)
+        )
 
-            # date/time entry
-            ttk.Label(frame, text="Date/Time:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
-            datetime_var = tk.StringVar()
-
-            # Set default date/time to upcoming Friday at 8PM EST
-            default_datetime = self.get_upcoming_friday()
-            datetime_var.set(default_datetime)
-
-            datetime_entry = ttk.Entry(frame, textvariable=datetime_var, width=30)
-            datetime_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
-
-            # scheduled checkbox
-            scheduled_var = tk.BooleanVar()
-            scheduled_check = ttk.Checkbutton(frame, text="Scheduled", variable=scheduled_var)
-            scheduled_check.grid(row=1, column=2, padx=5, pady=5, sticky="w")
-
-            # store references
-            match_info = {
-                "frame": frame,
-                "team1": team1_var,
-                "team2": team2_var,
-                "datetime": datetime_var,
-                "scheduled": scheduled_var
-            }
-            self.next_week_match_widgets.append(match_info)
-
-    def get_upcoming_friday(self):
-        today = datetime.date.today()
-        days_ahead = 4 - today.weekday()  # friday is weekday 4
-        if days_ahead <= 0:
-            days_ahead += 7
-        next_friday = today + datetime.timedelta(days=days_ahead)
-        return next_friday.strftime("%A (%b %d) at 8PM EST")
+        # date/time entry
+        ttk.Label(frame, text="Date/Time:").grid(row=1, column=0, padx=5, pady=5, sticky="e")
+        datetime_var = tk.StringVar()
+
+        datetime_entry = ttk.Entry(frame, textvariable=datetime_var, width=30)
+        datetime_entry.grid(row=1, column=1, padx=5, pady=5, sticky="w")
+
+        # scheduled checkbox
+        scheduled_var = tk.BooleanVar()
+        scheduled_check = ttk.Checkbutton(frame, text="Scheduled", variable=scheduled_var)
+        scheduled_check.grid(row=1, column=2, padx=5, pady=5, sticky="w")
+
+        # how the typed time was understood
+        time_label = ttk.Label(frame, text="")
+        time_label.grid(row=2, column=1, columnspan=3, padx=5, pady=(0, 5), sticky="w")
+
+        # store references
+        row = {
+            "frame": frame,
+            "team1": team1_var,
+            "team2": team2_var,
+            "team1_dropdown": team1_dropdown,
+            "team2_dropdown": team2_dropdown,
+            "datetime": datetime_var,
+            "scheduled": scheduled_var,
+            "time_label": time_label,
+            "match": None,
+            "binding": False
+        }
 
+        # write changes back to the bound match
+        for var in (team1_var, team2_var, datetime_var, scheduled_var):
+            var.trace_add("write", lambda *args, r=row: self.store_next_week_match(r))
+        self.attach_team_typeahead(NEXT_WEEK, row)
+
+        return row
+
+    def bind_next_week_row(self, row, match):
+        row["binding"] = True
+        row["match"] = match
+        row["frame"].configure(text=match.label)
+        row["team1"].set(match.team1)
+        row["team2"].set(match.team2)
+        row["datetime"].set(match.datetime)
+        row["scheduled"].set(match.scheduled)
+        self.show_conflicts(row, NEXT_WEEK)
+        self.show_time(row)
+        row["binding"] = False
+
+    def store_next_week_match(self, row):
+        if row["binding"]:
+            return
+        self.team_callbacks += 1
+
+        match = row["match"]
+        match.team1 = self.typed_team(row, "team1")
+        match.team2 = self.typed_team(row, "team2")
+        match.scheduled = row["scheduled"].get()
+        self.assign_teams(NEXT_WEEK, match)
+
+        # only re-parse when the text changed, not on every team or checkbox edit
+        datetime_text = row["datetime"].get()
+        if datetime_text != match.datetime:
+            match.datetime = datetime_text
+            try:
+                match.start = parse_time(datetime_text, self.week_start)
+            except ValueError:
+                match.start = None
+            self.show_time(row)
+        self.mark_dirty()
+
+    def show_time(self, row):
+        match = row["match"]
+        if match.start is not None:
+            row["time_label"].configure(text=f"→ {format_time(match.start)}", foreground="")
+        elif match.datetime.strip():
+            row["time_label"].configure(text="Unrecognized time, try \"Friday 8PM EST\"", foreground="#d62828")
+        else:
+            row["time_label"].configure(text="", foreground="")
 
-if __name__ == "__main__":
-    app = UTOWPocketCoordinator()
+    def plan_streams(self):
+        streams = simpledialog.askinteger(
+            "Plan Streams", "How many matches can be streamed at once?", initialvalue=1, minvalue=1, parent=self
+        )
+        if not streams:
+            return
+
+        index = IntervalIndex.from_matches(self.next_week_matches)
+        assignment = index.max_streamable(streams)
+        overlaps = index.overlaps()
+        untimed = [match.label for match in self.next_week_matches if match.start is None]
+
+        # stream n: the matches it carries, in start order
+        by_number = {match.number: match for match in self.next_week_matches}
+        lines = []
+        for stream in range(streams):
+            numbers = [number for number, assigned in assignment.items() if assigned == stream]
+            if numbers:
+                lines.append(f"Stream {stream + 1}:")
+                lines.extend(
+                    f"  {by_number[number].label} ({format_time(by_number[number].start)})" for number in numbers
+                )
+        skipped = len(index) - len(assignment)
+        lines.append(f"{len(assignment)} of {len(index)} timed matches can be streamed, {skipped} left over.")
+        lines.append(f"{len(overlaps)} overlapping pair(s).")
+        if untimed:
+            lines.append(f"No usable time: {', '.join(untimed)}")
+
+        # free starts from friday noon through the weekend
+        window_start = self.week_start.replace(hour=12, minute=0)
+        free = index.free_slots(window_start, window_start + datetime.timedelta(days=3), streams)
+        if free:
+            lines.append("Free slots: " + ", ".join(format_time(start) for start in free[:5]))
+        messagebox.showinfo("Plan Streams", "\n".join(lines))
+
+    def new_week(self):
+        if not messagebox.askyesno("New Week", "Start a new week? Next week's pairings become this week's matches."):
+            return
+
+        # a week that was never generated keeps its number
+        self.week_number = self.season_store.next_week()
+        pairings = [(match.team1, match.team2) for match in self.next_week_matches]
+
+        self.render_matches()
+        for match, (team1, team2) in zip(self.matches, pairings):
+            match.team1 = team1
+            match.team2 = team2
+        self.assignments.load(THIS_WEEK, self.matches)
+        self.match_list.set_items(self.matches)
+
+        if self.bye_team is not None:
+            self.bye_team = ""
+        self.render_next_week_matches()
+        self.show_bye()
+        self.announcement_text.delete("1.0", tk.END)
+        self.mark_dirty()
+
+    def mark_dirty(self):
+
+        # snapshot once per idle cycle, the writer thread debounces the disk write
+        if not self.autosave_pending:
+            self.autosave_pending = True
+            self.after_idle(self.autosave)
+
+    def autosave(self):
+        self.autosave_pending = False
+        self.autosave_writer.submit(
+            snapshot_session(self.matches, self.next_week_matches, self.bye_team, self.week_number)
+        )
+
+    def restore_last_session(self):
+        state = load_session(self.division.session)
+        if state is None:
+            return
+
+        try:
+            matches, next_week_matches, bye_team, week_number = restore_session(state)
+        except (KeyError, TypeError, ValueError):
+            return
+
+        # a session from a differently sized league does not fit the form
+        if len(matches) != self.num_matches or len(next_week_matches) != self.num_matches:
+            return
+
+        self.matches = matches
+        self.next_week_matches = next_week_matches
+        if self.bye_team is not None:
+            self.bye_team = bye_team or ""
+        self.week_number = week_number
+        self.assignments.load(THIS_WEEK, self.matches)
+        self.assignments.load(NEXT_WEEK, self.next_week_matches, self.bye_team)
+        self.match_list.set_items(self.matches)
+        self.next_week_list.set_items(self.next_week_matches)
+        self.show_bye()
+
+    def start_profiling(self):
+
+        # widget methods created in create_widgets, where the time goes besides our own code
+        self.profiler.instrument(self.announcement_text, ("insert", "delete"), "announcement_text.")
+        self.profiler.instrument(self.match_list, ("refresh", "relayout", "measure"), "match_list.")
+        self.profiler.instrument(self.next_week_list, ("refresh", "relayout", "measure"), "next_week_list.")
+        self.lag_probe = LagProbe(self, self.profiler)
+        self.profile_panel = None
+        self.bind_all("<Control-P>", lambda e: self.show_profile_panel())
+
+    def show_profile_panel(self):
+        if self.profile_panel is not None and self.profile_panel.winfo_exists():
+            self.profile_panel.refresh()
+            self.profile_panel.lift()
+            return
+        self.profile_panel = ProfilePanel(self, self.profiler, self.profile_file)
+
+    def on_close(self):
+        self.autosave()
+        self.autosave_writer.close()
+        self.season_store.close()
+        if self.profiler:
+            try:
+                self.profiler.export(self.profile_file)
+            except OSError:
+                pass
+        self.destroy()
+
+
+class DivisionBoard(tk.Tk):
+    def __init__(self, manifest_path):
+        super().__init__()
+        self.title("UTOW Pocket Coordinator - Divisions")
+        self.geometry("600x500")
+
+        self.manifest_path = manifest_path
+        self.divisions = load_manifest(manifest_path)
+
+        # worker results arrive on a background thread, the ui polls this queue
+        self.progress = queue.Queue()
+        self.running = False
+
+        self.style = ttk.Style()
+        self.style.configure("Header.TLabelframe.Label", foreground="#b54882")
+        self.create_widgets()
+
+    def create_widgets(self):
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        divisions_frame = ttk.LabelFrame(self, text="Divisions", style="Header.TLabelframe")
+        divisions_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        divisions_frame.grid_rowconfigure(0, weight=1)
+        divisions_frame.grid_columnconfigure(0, weight=1)
+
+        columns = ("status", "messages", "time")
+        self.tree = ttk.Treeview(divisions_frame, columns=columns, selectmode="browse")
+        self.tree.heading("#0", text="Division")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("messages", text="Messages")
+        self.tree.heading("time", text="Time")
+        self.tree.column("messages", width=70, anchor="e")
+        self.tree.column("time", width=70, anchor="e")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.tree.bind("<Double-1>", lambda e: self.open_division())
+
+        scrollbar = ttk.Scrollbar(divisions_frame, orient="vertical", command=self.tree.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        for num, division in enumerate(self.divisions):
+            self.tree.insert("", "end", iid=str(num), text=division.name, values=("", "", ""))
+        self.rows = {division.name: str(num) for num, division in enumerate(self.divisions)}
+
+        buttons_frame = ttk.Frame(self)
+        buttons_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
+
+        self.generate_btn = ttk.Button(buttons_frame, text="Generate All", command=lambda: self.run_all(True))
+        self.generate_btn.pack(side="left", padx=5)
+
+        self.validate_btn = ttk.Button(buttons_frame, text="Validate All", command=lambda: self.run_all(False))
+        self.validate_btn.pack(side="left", padx=5)
+
+        open_btn = ttk.Button(buttons_frame, text="Open Division", command=self.open_division)
+        open_btn.pack(side="left", padx=5)
+
+        self.progress_bar = ttk.Progressbar(buttons_frame, maximum=max(len(self.divisions), 1))
+        self.progress_bar.pack(side="left", fill="x", expand=True, padx=5)
+
+        self.summary_label = ttk.Label(buttons_frame, text="")
+        self.summary_label.pack(side="right", padx=5)
+
+    def run_all(self, save):
+        if self.running or not self.divisions:
+            return
+        self.running = True
+        self.generate_btn.state(["disabled"])
+        self.validate_btn.state(["disabled"])
+        self.progress_bar["value"] = 0
+        for num in range(len(self.divisions)):
+            self.tree.item(str(num), values=("Queued", "", ""))
+
+        # spawn keeps tk state out of the worker processes
+        context = multiprocessing.get_context("spawn")
+
+        def work():
+            try:
+                results = run_divisions(
+                    self.divisions, save=save, mp_context=context,
+                    on_progress=lambda result, done, total: self.progress.put(result)
+                )
+            except Exception as e:
+                results = e
+            self.progress.put(results)
+
+        threading.Thread(target=work, name="divisions", daemon=True).start()
+        self.after(50, self.poll_progress)
+
+    def poll_progress(self):
+        while True:
+            try:
+                item = self.progress.get_nowait()
+            except queue.Empty:
+                break
+
+            if isinstance(item, dict):
+                self.show_result(item)
+                self.progress_bar["value"] += 1
+                continue
+
+            # the whole run is done, a list of results or the error that stopped it
+            self.running = False
+            self.generate_btn.state(["!disabled"])
+            self.validate_btn.state(["!disabled"])
+            if isinstance(item, Exception):
+                messagebox.showerror("Error", f"An error occurred: {item}")
+                return
+            failed = sum(1 for result in item if not result["ok"])
+            self.summary_label.configure(text=f"{len(item) - failed} of {len(item)} ok")
+            return
+        self.after(50, self.poll_progress)
+
+    def show_result(self, result):
+        if result["ok"]:
+            status = f"Week {result['week']} ok"
+        else:
+            status = f"{result['title']}: {result['error']}"
+        self.tree.item(self.rows[result["name"]], values=(status, result["messages"], f"{result['elapsed']:.2f}s"))
+
+    def open_division(self):
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showwarning("No Division", "Select a division to open.")
+            return
+
+        # each division gets its own editor process, like running one window per division
+        division = self.divisions[int(selection[0])]
+        subprocess.Popen([
+            sys.executable, os.path.abspath(__file__),
+            "--manifest", self.manifest_path, "--division", division.name
+        ])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="UTOW Pocket Coordinator")
+    parser.add_argument("--manifest", help=f"division manifest, e.g. {MANIFEST_FILE}")
+    parser.add_argument("--division", help="open one division from the manifest")
+    args = parser.parse_args(argv)
+
+    if not args.manifest:
+        app = UTOWPocketCoordinator()
+    elif args.division:
+        divisions = {division.name: division for division in load_manifest(args.manifest)}
+        if args.division not in divisions:
+            parser.error(f"no division named {args.division!r} in {args.manifest}")
+        app = UTOWPocketCoordinator(divisions[args.division])
+    else:
+        app = DivisionBoard(args.manifest)
     app.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+import datetime
+import re
+from bisect import bisect_left, bisect_right, insort
+
+# league night is friday at 8pm eastern
+DEFAULT_ZONE = "America/New_York"
+DEFAULT_WEEKDAY = 4
+DEFAULT_HOUR = 20
+
+# how long a match holds a stream
+MATCH_LENGTH = datetime.timedelta(hours=2)
+
+# abbreviations players type -> iana zone, with a fixed offset if tz data is missing
+ZONE_ABBREVIATIONS = {
+    "EST": ("America/New_York", -5), "EDT": ("America/New_York", -4), "ET": ("America/New_York", -5),
+    "CST": ("America/Chicago", -6), "CDT": ("America/Chicago", -5), "CT": ("America/Chicago", -6),
+    "MST": ("America/Denver", -7), "MDT": ("America/Denver", -6), "MT": ("America/Denver", -7),
+    "PST": ("America/Los_Angeles", -8), "PDT": ("America/Los_Angeles", -7), "PT": ("America/Los_Angeles", -8),
+    "UTC": ("UTC", 0), "GMT": ("Europe/London", 0), "BST": ("Europe/London", 1),
+    "CET": ("Europe/Berlin", 1), "CEST": ("Europe/Berlin", 2),
+    "KST": ("Asia/Seoul", 9), "AEST": ("Australia/Sydney", 10), "AEDT": ("Australia/Sydney", 11)
+}
+
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+MONTHS = ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+
+# "Friday (Oct 23) at 8PM EST", "oct 23 8:30pm pst", "fri 21:00", "9pm", "at 9pm"
+TIME_PATTERN = re.compile(
+    r"^\s*(?:(?P<weekday>(?!at(?![a-z]))[a-z]+)\.?,?\s*)?"
+    r"(?:\(?\s*(?P<month>[a-z]{3})[a-z]*\.?\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?\s*\)?,?\s*)?"
+    r"(?:at\s+|@\s*)?"
+    r"(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>am|pm)?"
+    r"\s*(?P<zone>[a-z]{2,4})?\s*$",
+    re.IGNORECASE
+)
+
+_zones = {}
+
+
+def get_zone(name):
+
+    # zoneinfo needs the tzdata package on windows, fall back to fixed offsets
+    zone = _zones.get(name)
+    if zone is None:
+        key, offset = ZONE_ABBREVIATIONS.get(name.upper(), (name, None))
+        try:
+            from zoneinfo import ZoneInfo
+            zone = ZoneInfo(key)
+        except (ImportError, ValueError, OSError):
+            if offset is None:
+                offset = -5 if key == DEFAULT_ZONE else 0
+            zone = datetime.timezone(datetime.timedelta(hours=offset), name.upper())
+        _zones[name] = zone
+    return zone
+
+
+def upcoming_friday(today=None, zone=DEFAULT_ZONE, hour=DEFAULT_HOUR):
+    today = today or datetime.date.today()
+    days_ahead = DEFAULT_WEEKDAY - today.weekday()
+    if days_ahead <= 0:
+        days_ahead += 7
+    day = today + datetime.timedelta(days=days_ahead)
+    return datetime.datetime(day.year, day.month, day.day, hour, tzinfo=get_zone(zone))
+
+
+def parse_time(text, reference=None, zone=DEFAULT_ZONE):
+
+    # reference is the default date, usually the week's friday
+    text = text.strip()
+
+    # "2026-10-23T20:00:00-04:00[America/New_York]" as written by dump_time
+    iso_text, _, zone_key = text.partition("[")
+    try:
+        value = datetime.datetime.fromisoformat(iso_text)
+    except ValueError:
+        value = None
+    if value is not None:
+        if zone_key:
+            return value.astimezone(get_zone(zone_key.rstrip("]")))
+        return value if value.tzinfo else value.replace(tzinfo=get_zone(zone))
+
+    reference = reference or upcoming_friday(zone=zone)
+
+    found = TIME_PATTERN.match(text)
+    if not found:
+        raise ValueError(f"Unrecognized time: {text!r}")
+
+    hour = int(found["hour"])
+    minute = int(found["minute"] or 0)
+    ampm = (found["ampm"] or "").lower()
+    if ampm:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Unrecognized time: {text!r}")
+        hour = hour % 12 + (12 if ampm == "pm" else 0)
+    if hour > 23 or minute > 59:
+        raise ValueError(f"Unrecognized time: {text!r}")
+
+    tz = reference.tzinfo
+    if found["zone"]:
+        if found["zone"].upper() not in ZONE_ABBREVIATIONS:
+            raise ValueError(f"Unknown time zone: {found['zone']!r}")
+        tz = get_zone(found["zone"])
+    day = reference.astimezone(tz).date() if found["zone"] else reference.date()
+
+    if found["month"]:
+        month = found["month"].lower()
+        if month not in MONTHS:
+            raise ValueError(f"Unrecognized month: {found['month']!r}")
+
+        # "Jan 2" typed in december means next year
+        day = datetime.date(day.year, MONTHS.index(month) + 1, int(found["day"]))
+        if (day - reference.date()).days < -180:
+            day = day.replace(year=day.year + 1)
+    elif found["weekday"]:
+        weekday = found["weekday"].lower()
+        matches = [num for num, name in enumerate(WEEKDAYS) if name.startswith(weekday)]
+        if len(weekday) < 2 or len(matches) != 1:
+            raise ValueError(f"Unrecognized day: {found['weekday']!r}")
+
+        # the named day in the week that starts on the reference's monday
+        day = day - datetime.timedelta(days=day.weekday()) + datetime.timedelta(days=matches[0])
+
+    return datetime.datetime(day.year, day.month, day.day, hour, minute, tzinfo=tz)
+
+
+def dump_time(value):
+
+    # iso offset plus the zone name, so a reload still shows EST/EDT correctly
+    key = getattr(value.tzinfo, "key", None)
+    return f"{value.isoformat()}[{key}]" if key else value.isoformat()
+
+
+def format_time(value):
+
+    # "Friday (Oct 23) at 8PM EDT", minutes only when they are not zero
+    hour = value.hour % 12 or 12
+    clock = f"{hour}:{value.minute:02d}" if value.minute else f"{hour}"
+    ampm = "PM" if value.hour >= 12 else "AM"
+    return f"{value:%A (%b %d)} at {clock}{ampm} {value.tzname()}"
+
+
+class IntervalIndex:
+    def __init__(self, length=MATCH_LENGTH):
+        self.length = length
+
+        # (start, key) sorted by start, intervals all have the same length
+        self.starts = []
+        self.intervals = {}
+
+    @classmethod
+    def from_matches(cls, matches, length=MATCH_LENGTH):
+
+        # matches without a parsed time are left out
+        index = cls(length)
+        for match in matches:
+            if match.start is not None:
+                index.add(match.number, match.start)
+        return index
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def add(self, key, start):
+        if key in self.intervals:
+            self.remove(key)
+        timestamp = start.timestamp()
+        self.intervals[key] = timestamp
+        insort(self.starts, (timestamp, key))
+
+    def remove(self, key):
+        timestamp = self.intervals.pop(key)
+        del self.starts[bisect_left(self.starts, (timestamp, key))]
+
+    def overlapping(self, start, end=None):
+
+        # anything starting less than one length before the end and after start - length
+        begin = start.timestamp()
+        finish = (end or start + self.length).timestamp()
+        length = self.length.total_seconds()
+        low = bisect_right(self.starts, (begin - length, float("inf")))
+        high = bisect_left(self.starts, (finish, float("-inf")))
+        return [key for _, key in self.starts[low:high]]
+
+    def overlaps(self):
+
+        # every overlapping pair, found with one sweep over the sorted starts
+        length = self.length.total_seconds()
+        pairs = []
+        starts = self.starts
+        for num, (timestamp, key) in enumerate(starts):
+            other = num + 1
+            while other < len(starts) and starts[other][0] < timestamp + length:
+                pairs.append((key, starts[other][1]))
+                other += 1
+        return pairs
+
+    def max_streamable(self, streams=1):
+
+        # equal lengths, so start order is end order: take each match if some stream
+        # is free, using the stream that freed up last, which is optimal for k streams
+        free_at = []
+        assignment = {}
+        opened = 0
+        length = self.length.total_seconds()
+        for timestamp, key in self.starts:
+            slot = bisect_right(free_at, (timestamp, float("inf"))) - 1
+            if slot >= 0:
+                _, stream = free_at.pop(slot)
+            elif opened < streams:
+                stream = opened
+                opened += 1
+            else:
+                continue
+            assignment[key] = stream
+            insort(free_at, (timestamp + length, stream))
+        return assignment
+
+    def free_slots(self, window_start, window_end, streams=1, step=datetime.timedelta(minutes=30)):
+
+        # starts in the window where a new match would still fit on a stream
+        slots = []
+        length = self.length.total_seconds()
+        current = window_start
+        while current + self.length <= window_end:
+            begin = current.timestamp()
+            low = bisect_right(self.starts, (begin - length, float("inf")))
+            high = bisect_left(self.starts, (begin + length, float("-inf")))
+            if self.max_concurrent(self.starts[low:high], begin, begin + length) < streams:
+                slots.append(current)
+            current += step
+        return slots
+
+    def max_concurrent(self, intervals, begin, end):
+
+        # peak number of intervals running at once inside [begin, end)
+        length = self.length.total_seconds()
+        events = []
+        for timestamp, _ in intervals:
+            events.append((max(timestamp, begin), 1))
+            events.append((min(timestamp + length, end), -1))
+        events.sort()
+        running = peak = 0
+        for _, change in events:
+            running += change
+            peak = max(peak, running)
+        return peak
@@ -0,0 +1,119 @@
+from match_times import format_time, parse_time
+
+MIN_GAMES = 3
+MAX_GAMES = 6
+
+
+class Game:
+    __slots__ = ("map", "winner")
+
+    def __init__(self, map_name="", winner=""):
+        self.map = map_name
+        self.winner = winner
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("map", ""), data.get("winner", ""))
+
+
+class Match:
+    __slots__ = ("number", "team1", "team2", "games")
+
+    def __init__(self, number, team1="", team2="", num_games=MIN_GAMES):
+        self.number = number
+        self.team1 = team1
+        self.team2 = team2
+        self.games = [Game() for _ in range(num_games)]
+
+    @property
+    def label(self):
+        return f"Match {self.number}"
+
+    @classmethod
+    def from_dict(cls, number, data):
+        match = cls(number, data.get("team1", ""), data.get("team2", ""), num_games=0)
+        match.games = [Game.from_dict(game) for game in data.get("games", [])]
+        return match
+
+
+class ScheduledMatch:
+    __slots__ = ("number", "team1", "team2", "datetime", "scheduled", "start")
+
+    def __init__(self, number, team1="", team2="", datetime="", scheduled=False, start=None):
+        self.number = number
+        self.team1 = team1
+        self.team2 = team2
+        self.scheduled = scheduled
+
+        # datetime is the text as typed, start is the parsed time-zone-aware value or None
+        self.datetime = datetime
+        self.start = start
+
+    @property
+    def label(self):
+        return f"Match {self.number}"
+
+    @property
+    def display_time(self):
+        return format_time(self.start) if self.start is not None else self.datetime
+
+    @classmethod
+    def from_dict(cls, number, data):
+
+        # "start" is an iso timestamp, week files written by hand may only have the text
+        start = data.get("start")
+        return cls(
+            number, data.get("team1", ""), data.get("team2", ""),
+            data.get("datetime", ""), bool(data.get("scheduled", False)),
+            parse_time(start) if start else None
+        )
+
+
+class Week:
+    __slots__ = ("matches", "next_week", "bye_team")
+
+    def __init__(self, matches=None, next_week=None, bye_team=None):
+        self.matches = matches if matches is not None else []
+        self.next_week = next_week if next_week is not None else []
+        self.bye_team = bye_team
+
+    @classmethod
+    def from_dict(cls, data):
+
+        # same keys as the cli week files: matches, next_week, bye
+        return cls(
+            [Match.from_dict(num, match) for num, match in enumerate(data.get("matches", []), start=1)],
+            [ScheduledMatch.from_dict(num, match) for num, match in enumerate(data.get("next_week", []), start=1)],
+            data.get("bye")
+        )
+
+
+def new_matches(num_matches):
+    return [Match(match_num) for match_num in range(1, num_matches + 1)]
+
+
+def new_schedule(num_matches, week_start):
+
+    # every match defaults to the week's start, formatted once
+    default_datetime = format_time(week_start)
+    return [
+        ScheduledMatch(match_num, datetime=default_datetime, start=week_start)
+        for match_num in range(1, num_matches + 1)
+    ]
+
+
+def add_game(match):
+
+    # the new game, or None when the match is already at the limit
+    if len(match.games) >= MAX_GAMES:
+        return None
+    game = Game()
+    match.games.append(game)
+    return game
+
+
+def remove_game(match):
+    if len(match.games) <= MIN_GAMES:
+        return False
+    match.games.pop()
+    return True
@@ -0,0 +1,70 @@
+RECENT_WEIGHT = 4.0
+DECAY = 0.5
+
+
+def maps_played(entries):
+
+    # team -> maps that team played in the given results
+    played = {}
+    for entry in entries:
+        maps = {game["map"] for game in entry["games"]}
+        played.setdefault(entry["team1"], set()).update(maps)
+        played.setdefault(entry["team2"], set()).update(maps)
+    return played
+
+
+class RotationPlanner:
+    def __init__(self, maps, game_mode_order, recent_weight=RECENT_WEIGHT, decay=DECAY):
+        self.game_mode_order = game_mode_order
+        self.recent_weight = recent_weight
+        self.decay = decay
+
+        # per-mode index built once from load_maps
+        self.mode_maps = {mode: list(maps.get(mode, [])) for mode in game_mode_order}
+        self.season = {name: 0 for names in self.mode_maps.values() for name in names}
+        self.recent = dict.fromkeys(self.season, 0.0)
+
+    @classmethod
+    def from_store(cls, store, maps, game_mode_order):
+        planner = cls(maps, game_mode_order)
+        for week in sorted(store.weeks):
+            planner.record_week(store.week_results(week))
+        return planner
+
+    def record_week(self, entries):
+
+        # older weeks fade, season totals keep counting
+        for name in self.recent:
+            self.recent[name] *= self.decay
+        for entry in entries:
+            for game in entry["games"]:
+                if game["map"] in self.season:
+                    self.season[game["map"]] += 1
+                    self.recent[game["map"]] += 1
+
+    def plan_week(self, matches, recent_maps=None):
+
+        # matches: (team1, team2, num_games), returns one list of maps per match
+        recent_maps = recent_maps or {}
+        planned = dict.fromkeys(self.season, 0)
+
+        def score(name):
+            return self.recent_weight * self.recent[name] + self.season[name] + planned[name]
+
+        plan = []
+        for team1, team2, num_games in matches:
+            avoid = recent_maps.get(team1, set()) | recent_maps.get(team2, set())
+            series = []
+            for mode in self.game_mode_order[:num_games]:
+                candidates = [name for name in self.mode_maps[mode] if name not in series]
+
+                # skip maps either team just played, unless that leaves nothing
+                fresh = [name for name in candidates if name not in avoid]
+                if not candidates:
+                    series.append("")
+                    continue
+                choice = min(fresh or candidates, key=score)
+                planned[choice] += 1
+                series.append(choice)
+            plan.append(series)
+        return plan
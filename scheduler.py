@@ -0,0 +1,135 @@
+class Round:
+    __slots__ = ("line",)
+
+    # teams in seat order, seat i plays seat -1 - i, None marks the bye
+    def __init__(self, line):
+        self.line = line
+
+    @property
+    def pairs(self):
+        half = len(self.line) // 2
+        return [
+            (team1, team2) for team1, team2 in zip(self.line[:half], self.line[:half - 1:-1])
+            if team1 is not None and team2 is not None
+        ]
+
+    @property
+    def bye(self):
+        if None not in self.line:
+            return None
+        seat = self.line.index(None)
+        return self.line[-1 - seat]
+
+
+def round_robin(teams, rounds=None):
+
+    # circle method: one team stays put, the rest rotate one seat per round
+    teams = list(teams)
+    if len(teams) % 2 == 1:
+        teams.append(None)
+    num_teams = len(teams)
+    if num_teams < 2:
+        return []
+
+    # rotating one seat per round is a sliding window over the doubled ring,
+    # the placeholder meets every team once so byes rotate through the whole league
+    fixed, rotating = teams[0], teams[1:]
+    ring = rotating + rotating
+    cycle = len(rotating)
+    schedule = []
+    for round_num in range(rounds or num_teams - 1):
+        start = cycle - round_num % cycle
+        schedule.append(Round([fixed] + ring[start:start + cycle]))
+    return schedule
+
+
+def swiss_round(teams, standings=None, byes=None):
+    byes = byes or {}
+    records = standings.records if standings is not None else {}
+
+    # best team first, teams without a record keep their given order at the bottom
+    ranked = sorted(
+        teams,
+        key=lambda team: (-records[team].points, -records[team].map_diff, -records[team].rating)
+        if team in records else (0, 0, 0)
+    )
+
+    def played(team):
+        record = records.get(team)
+        return record.head_to_head if record is not None else {}
+
+    # lowest ranked team among those with the fewest byes sits out
+    bye = None
+    if len(ranked) % 2 == 1:
+        fewest = min(byes.get(team, 0) for team in ranked)
+        for seat in range(len(ranked) - 1, -1, -1):
+            if byes.get(ranked[seat], 0) == fewest:
+                bye = ranked.pop(seat)
+                break
+
+    # linked list of unpaired seats so each pairing skips already paired teams
+    num_teams = len(ranked)
+    next_seat = list(range(1, num_teams + 1))
+    prev_seat = list(range(-1, num_teams - 1))
+    first = 0
+
+    def take(seat):
+        nonlocal first
+        before, after = prev_seat[seat], next_seat[seat]
+        if before >= 0:
+            next_seat[before] = after
+        else:
+            first = after
+        if after < num_teams:
+            prev_seat[after] = before
+
+    pairs = []
+    while first < num_teams:
+        seat = first
+        take(seat)
+        team = ranked[seat]
+        opponents = played(team)
+
+        # closest ranked team below that this team has not played yet
+        partner = first
+        while partner < num_teams and ranked[partner] in opponents:
+            partner = next_seat[partner]
+        if partner >= num_teams:
+            partner = first
+        take(partner)
+        pairs.append((team, ranked[partner]))
+
+    return repair_rematches(pairs, played), bye
+
+
+def repair_rematches(pairs, played):
+
+    # greedy pairing can strand two teams that already met, swap with an earlier pair
+    for index in range(len(pairs) - 1, -1, -1):
+        team1, team2 = pairs[index]
+        if team2 not in played(team1):
+            continue
+        for other in range(index - 1, -1, -1):
+            team3, team4 = pairs[other]
+            if team3 not in played(team1) and team4 not in played(team2):
+                pairs[index], pairs[other] = (team1, team3), (team4, team2)
+                break
+            if team4 not in played(team1) and team3 not in played(team2):
+                pairs[index], pairs[other] = (team1, team4), (team3, team2)
+                break
+    return pairs
+
+
+def byes_from_store(store, teams):
+
+    # a team missing from a week's results had the bye that week
+    byes = {}
+    teams = set(teams)
+    for week in store.weeks:
+        played = set()
+        for entry in store.week_results(week):
+            played.add(entry["team1"])
+            played.add(entry["team2"])
+        for team in teams - played:
+            byes[team] = byes.get(team, 0) + 1
+    return byes
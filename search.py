@@ -0,0 +1,112 @@
+import re
+from bisect import bisect_left
+
+# how many suggestions a dropdown shows at once
+SUGGESTION_LIMIT = 50
+
+
+def normalize(name):
+    return " ".join(name.casefold().split())
+
+
+# "team blue fox" -> 5, 10: where every word after the first starts
+WORD_START = re.compile(r"(?<=[ \-_.])[^ \-_.]")
+
+
+def word_starts(key):
+    return [found.start() for found in WORD_START.finditer(key)]
+
+
+class NameIndex:
+    def __init__(self, values, keys=None):
+
+        # values are what the dropdown shows, keys are what gets matched (map display names)
+        self.values = list(values)
+        self.keys = [normalize(key) for key in (keys if keys is not None else self.values)]
+        self.lookup = {value: num for num, value in enumerate(self.values)}
+        self.exact = {key: num for num, key in reversed(list(enumerate(self.keys)))}
+
+        # whole names and word suffixes, both sorted for bisect range scans
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self.full_keys = [self.keys[num] for num in order]
+        self.full_ids = order
+
+        words = sorted((key[pos:], num) for num, key in enumerate(self.keys) for pos in word_starts(key))
+        self.word_keys = [key for key, _ in words]
+        self.word_ids = [num for _, num in words]
+
+        # trigram -> ids in value order, built the first time a query needs it
+        self._trigrams = None
+
+    @property
+    def trigrams(self):
+        if self._trigrams is None:
+            trigrams = {}
+            for num, key in enumerate(self.keys):
+                for trigram in {key[pos:pos + 3] for pos in range(len(key) - 2)}:
+                    postings = trigrams.get(trigram)
+                    if postings is None:
+                        trigrams[trigram] = [num]
+                    else:
+                        postings.append(num)
+            self._trigrams = trigrams
+        return self._trigrams
+
+    @classmethod
+    def from_pairs(cls, pairs):
+
+        # (display name, value) pairs, the shape catalog.build_maps stores
+        return cls([value for _, value in pairs], [key for key, _ in pairs])
+
+    def __contains__(self, value):
+        return value in self.lookup
+
+    def __len__(self):
+        return len(self.values)
+
+    def resolve(self, text):
+
+        # the value a typed name stands for, matching either the value or its key
+        if text in self.lookup:
+            return text
+        num = self.exact.get(normalize(text))
+        return self.values[num] if num is not None else None
+
+    def search(self, query, limit=SUGGESTION_LIMIT, exclude=(), keep=None):
+
+        # whole-name prefixes first, then word prefixes, then anywhere in the name
+        query = normalize(query)
+        results = []
+        seen = set()
+
+        def add(num):
+            if num in seen:
+                return False
+            seen.add(num)
+            value = self.values[num]
+            if value in exclude and value != keep:
+                return False
+            results.append(value)
+            return len(results) >= limit
+
+        if not query:
+            for num in self.full_ids:
+                if add(num):
+                    break
+            return results
+
+        for keys, ids in ((self.full_keys, self.full_ids), (self.word_keys, self.word_ids)):
+            pos = bisect_left(keys, query)
+            while pos < len(keys) and keys[pos].startswith(query):
+                if add(ids[pos]):
+                    return results
+                pos += 1
+
+        if len(query) >= 3:
+
+            # walk the rarest trigram's ids and confirm the substring, stops at the limit
+            trigrams = [self.trigrams.get(query[pos:pos + 3], ()) for pos in range(len(query) - 2)]
+            for num in min(trigrams, key=len):
+                if query in self.keys[num] and add(num):
+                    break
+        return results
@@ -0,0 +1,247 @@
+import json
+import os
+from utils import write_atomic
+
+# how far the index file may trail the log before an append saves it, load() indexes the rest
+INDEX_SLACK = 1 << 20
+
+# written before each append as {"begin": count}, entries only count once all of them made it to disk
+BEGIN = "begin"
+
+
+def map_key(map_name):
+
+    # index maps by display name, so "Busan" matches ":flag_kr: __Busan__"
+    if "__" in map_name:
+        return map_name.split("__")[1].strip()
+    return map_name.strip()
+
+
+def save_week(store, week, results, last_week_path):
+
+    # the last week dump and the season log; the same week number replaces the earlier results
+    write_atomic(last_week_path, json.dumps(results, indent=4).encode('utf-8'))
+    store.append_week(week, results)
+
+
+class SeasonStore:
+    def __init__(self, path='season_results.jsonl'):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.reset()
+        self.load()
+
+    def reset(self):
+
+        # byte offsets of match entries in the log
+        self.size = 0
+        self.saved_size = 0
+        self.weeks = {}
+        self.batches = {}
+        self.teams = {}
+        self.maps = {}
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as file:
+                index = json.load(file)
+            self.size = index["size"]
+            self.weeks = {int(week): offsets for week, offsets in index["weeks"].items()}
+            self.batches = {int(week): batch for week, batch in index["batches"].items()}
+            self.teams = {team: set(offsets) for team, offsets in index["teams"].items()}
+            self.maps = {name: set(offsets) for name, offsets in index["maps"].items()}
+            self.saved_size = self.size
+        except (OSError, ValueError, KeyError):
+            self.reset()
+        self.sync()
+
+    def sync(self):
+
+        # catch up with appends made since the index was saved, or by another process since we last looked
+        log_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if log_size < self.size:
+
+            # log was replaced underneath us, start over
+            self.reset()
+        if log_size > self.size:
+            self.index_tail(log_size)
+            self.save_if_behind()
+
+    def index_tail(self, log_size):
+
+        # offset is where the last complete append ends, anything after it is a torn or corrupt write
+        offset = self.size
+        position = offset
+        pending = []
+        expected = 0
+        with open(self.path, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not isinstance(record, dict):
+                    break
+                if BEGIN in record:
+                    if expected:
+                        break
+                    expected = record[BEGIN]
+                    pending = []
+                elif expected:
+                    pending.append((position, record))
+                else:
+                    break
+                position += len(line)
+
+                if expected and len(pending) == expected:
+                    for entry_offset, entry in pending:
+                        self.index_entry(entry_offset, entry)
+                    offset = position
+                    pending = []
+                    expected = 0
+
+        if offset < log_size:
+            with open(self.path, 'r+b') as file:
+                file.truncate(offset)
+                os.fsync(file.fileno())
+        self.size = offset
+
+    def index_entry(self, offset, entry):
+        week = entry["week"]
+
+        # a newer batch for the same week replaces the earlier results
+        if self.batches.get(week) != entry["batch"]:
+            for old_entry, old_offset in zip(self.read(self.weeks.get(week, [])), self.weeks.get(week, [])):
+                self.unindex_entry(old_offset, old_entry)
+            self.weeks[week] = []
+            self.batches[week] = entry["batch"]
+
+        self.weeks[week].append(offset)
+        for team in (entry["team1"], entry["team2"]):
+            self.teams.setdefault(team, set()).add(offset)
+        for game in entry["games"]:
+            self.maps.setdefault(map_key(game["map"]), set()).add(offset)
+
+    def unindex_entry(self, offset, entry):
+        for team in (entry["team1"], entry["team2"]):
+            self.teams.get(team, set()).discard(offset)
+        for game in entry["games"]:
+            self.maps.get(map_key(game["map"]), set()).discard(offset)
+
+    def save_index(self):
+        index = {
+            "size": self.size,
+            "weeks": self.weeks,
+            "batches": self.batches,
+            "teams": {team: sorted(offsets) for team, offsets in self.teams.items() if offsets},
+            "maps": {name: sorted(offsets) for name, offsets in self.maps.items() if offsets}
+        }
+        write_atomic(self.index_path, json.dumps(index, separators=(",", ":")).encode('utf-8'))
+        self.saved_size = self.size
+
+    def save_if_behind(self):
+
+        # a save rewrites the whole index, so the allowed lag grows with the log to keep appends cheap
+        if self.size - self.saved_size > max(INDEX_SLACK, self.saved_size // 2):
+            self.save_index()
+
+    def close(self):
+        if self.size != self.saved_size:
+            self.save_index()
+
+    def append_week(self, week, entries):
+        self.append_weeks([(week, None, entries)])
+
+    def append_weeks(self, weeks):
+
+        # (week, batch, entries): reusing a week's batch adds to it, a new batch replaces the week
+        with open(self.path, 'ab') as file:
+
+            # batch None is a new batch named after where the append lands, self.size may be stale
+            start = file.tell()
+            records = []
+            lines = [b""]
+            for week, batch, entries in weeks:
+                for entry in entries:
+                    record = {"week": week, "batch": start if batch is None else batch}
+                    record.update(entry)
+                    records.append(record)
+                    lines.append(json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode('utf-8') + b"\n")
+            if not records:
+                return
+            lines[0] = json.dumps({BEGIN: len(records)}).encode('utf-8') + b"\n"
+
+            # one write + fsync per call
+            file.write(b"".join(lines))
+            file.flush()
+            os.fsync(file.fileno())
+
+        # index the records we already have, unless someone else wrote to the log since we last looked
+        if start != self.size:
+            self.sync()
+        else:
+            offset = start + len(lines[0])
+            for record, line in zip(records, lines[1:]):
+                self.index_entry(offset, record)
+                offset += len(line)
+            self.size = offset
+        self.save_if_behind()
+
+    def entries_after(self, offset):
+        with open(self.path, 'rb') as file:
+            file.seek(offset)
+            for line in file:
+                record = json.loads(line)
+                if BEGIN not in record:
+                    yield record
+
+    def truncate(self, size):
+
+        # drop everything from size on, then rebuild the index from the log
+        with open(self.path, 'r+b') as file:
+            file.truncate(size)
+            os.fsync(file.fileno())
+        self.reset()
+        self.index_tail(size)
+        self.save_index()
+
+    def read(self, offsets):
+        if not offsets:
+            return []
+        entries = []
+        with open(self.path, 'rb') as file:
+            for offset in offsets:
+                file.seek(offset)
+                entries.append(json.loads(file.readline()))
+        return entries
+
+    def next_week(self):
+        return max(self.weeks, default=0) + 1
+
+    def week_results(self, week):
+        return self.read(self.weeks.get(week, []))
+
+    def team_results(self, team):
+        return self.read(sorted(self.teams.get(team, ())))
+
+    def map_results(self, map_name):
+        return self.read(sorted(self.maps.get(map_key(map_name), ())))
+
+    def team_games(self, team, map_name):
+        offsets = self.teams.get(team, set()) & self.maps.get(map_key(map_name), set())
+        key = map_key(map_name)
+        games = []
+        for entry in self.read(sorted(offsets)):
+            for game in entry["games"]:
+                if map_key(game["map"]) == key:
+                    games.append({
+                        "week": entry["week"],
+                        "team1": entry["team1"],
+                        "team2": entry["team2"],
+                        "map": game["map"],
+                        "winner": game["winner"]
+                    })
+        return games
@@ -0,0 +1,139 @@
+BASE_RATING = 1500
+K_FACTOR = 32
+
+
+class TeamRecord:
+    __slots__ = ("team", "wins", "losses", "draws", "maps_won", "maps_lost", "rating", "head_to_head")
+
+    def __init__(self, team, rating=BASE_RATING):
+        self.team = team
+        self.wins = 0
+        self.losses = 0
+        self.draws = 0
+        self.maps_won = 0
+        self.maps_lost = 0
+        self.rating = rating
+
+        # opponent -> [wins, losses, draws]
+        self.head_to_head = {}
+
+    @property
+    def points(self):
+        return 3 * self.wins + self.draws
+
+    @property
+    def map_diff(self):
+        return self.maps_won - self.maps_lost
+
+
+class Standings:
+    def __init__(self, teams=(), k_factor=K_FACTOR, base_rating=BASE_RATING):
+        self.k_factor = k_factor
+        self.base_rating = base_rating
+        self.records = {team: TeamRecord(team, base_rating) for team in teams}
+
+        # week -> changes applied that week, kept so the latest week can be undone
+        self.weeks = {}
+
+    @classmethod
+    def from_store(cls, store, teams=()):
+        standings = cls(teams)
+        for week in sorted(store.weeks):
+            standings.apply_week(week, store.week_results(week))
+        return standings
+
+    def record(self, team):
+        record = self.records.get(team)
+        if record is None:
+            record = self.records[team] = TeamRecord(team, self.base_rating)
+        return record
+
+    def apply_week(self, week, entries):
+
+        # re-applying the latest week replaces it, older weeks need a rebuild
+        if week in self.weeks:
+            if week != max(self.weeks):
+                raise ValueError(f"Week {week} is not the latest week, rebuild the standings instead.")
+            self.undo_week(week)
+
+        changes = []
+        for entry in entries:
+            team1 = entry["team1"]
+            team2 = entry["team2"]
+            maps1 = sum(1 for game in entry["games"] if game["winner"] == team1)
+            maps2 = sum(1 for game in entry["games"] if game["winner"] == team2)
+
+            if entry["overall_winner"] == team1:
+                score = 1.0
+            elif entry["overall_winner"] == team2:
+                score = 0.0
+            else:
+                score = 0.5
+
+            record1 = self.record(team1)
+            record2 = self.record(team2)
+            expected = 1 / (1 + 10 ** ((record2.rating - record1.rating) / 400))
+            delta = self.k_factor * (score - expected)
+
+            change = (team1, team2, score, maps1, maps2, delta)
+            self.apply_change(change, 1)
+            changes.append(change)
+
+        self.weeks[week] = changes
+        return {team for change in changes for team in change[:2]}
+
+    def undo_week(self, week):
+        for change in reversed(self.weeks.pop(week)):
+            self.apply_change(change, -1)
+
+    def apply_change(self, change, sign):
+        team1, team2, score, maps1, maps2, delta = change
+        record1 = self.records[team1]
+        record2 = self.records[team2]
+
+        record1.rating += sign * delta
+        record2.rating -= sign * delta
+        record1.maps_won += sign * maps1
+        record1.maps_lost += sign * maps2
+        record2.maps_won += sign * maps2
+        record2.maps_lost += sign * maps1
+
+        h2h1 = record1.head_to_head.setdefault(team2, [0, 0, 0])
+        h2h2 = record2.head_to_head.setdefault(team1, [0, 0, 0])
+        if score == 1.0:
+            record1.wins += sign
+            record2.losses += sign
+            h2h1[0] += sign
+            h2h2[1] += sign
+        elif score == 0.0:
+            record1.losses += sign
+            record2.wins += sign
+            h2h1[1] += sign
+            h2h2[0] += sign
+        else:
+            record1.draws += sign
+            record2.draws += sign
+            h2h1[2] += sign
+            h2h2[2] += sign
+
+        # the scheduler treats a head-to-head key as "have played", so an undone meeting must leave none
+        if not any(h2h1):
+            del record1.head_to_head[team2]
+        if not any(h2h2):
+            del record2.head_to_head[team1]
+
+    def table(self):
+        return sorted(
+            self.records.values(),
+            key=lambda record: (-record.points, -record.map_diff, -record.rating, record.team)
+        )
+
+
+def render_standings(standings, limit=None):
+    lines = []
+    for place, record in enumerate(standings.table()[:limit], start=1):
+        lines.append(
+            f"{place}. {record.team}: {record.wins}W-{record.losses}L-{record.draws}D "
+            f"({record.map_diff:+d} maps, {record.rating:.0f})"
+        )
+    return "\n".join(lines)
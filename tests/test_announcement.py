@@ -0,0 +1,53 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from announcement import pack_messages, split_sections  # noqa: E402
+
+
+class PackMessagesTest(unittest.TestCase):
+    def assertPacked(self, messages, limit):
+        for message in messages:
+            self.assertTrue(message.strip(), messages)
+            self.assertLessEqual(len(message), limit)
+
+    def test_cut_blocks_leave_no_empty_messages(self):
+        text = "a" * 1999 + "\n\n" + "b" * 1999 + "\n\n" + "c"
+        messages = pack_messages(split_sections(text), 2000)
+
+        self.assertPacked(messages, 2000)
+        self.assertEqual(messages, ["a" * 1999, "b" * 1999, "c"])
+
+    def test_heading_section_leaves_no_empty_messages(self):
+        messages = pack_messages([["H\n\n", "x" * 49 + "\n\n", "y" * 60 + "\n\n"]], 50)
+
+        self.assertPacked(messages, 50)
+        self.assertEqual("".join(messages).replace("\n", ""), "H" + "x" * 49 + "y" * 60)
+
+    def test_section_that_fits_starts_a_message(self):
+        sections = [["# one\n\n", "a" * 30 + "\n\n"], ["# two\n\n", "b" * 30 + "\n\n"]]
+        self.assertEqual(pack_messages(sections, 50), ["# one\n\n" + "a" * 30, "# two\n\n" + "b" * 30])
+
+    def test_random_sections(self):
+        rng = random.Random(11)
+        for _ in range(500):
+            limit = rng.randint(10, 80)
+            sections = [
+                [
+                    "\n".join("x" * rng.randint(0, 2 * limit) for _ in range(rng.randint(1, 3))) + "\n" * rng.randint(0, 2)
+                    for _ in range(rng.randint(1, 5))
+                ]
+                for _ in range(rng.randint(1, 4))
+            ]
+            messages = pack_messages(sections, limit)
+
+            self.assertPacked(messages, limit)
+            text = "".join(block for section in sections for block in section)
+            self.assertEqual("".join(messages).replace("\n", ""), text.replace("\n", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
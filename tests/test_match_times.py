@@ -0,0 +1,44 @@
+import datetime
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from match_times import dump_time, format_time, parse_time, upcoming_friday  # noqa: E402
+
+
+class ParseTimeTest(unittest.TestCase):
+    def setUp(self):
+        self.friday = upcoming_friday(datetime.date(2026, 10, 19))
+
+    def assertParses(self, text, expected):
+        self.assertEqual(format_time(parse_time(text, self.friday)), expected)
+
+    def test_formats(self):
+        self.assertParses("Friday (Oct 23) at 8PM EST", "Friday (Oct 23) at 8PM EDT")
+        self.assertParses("oct 24 8:30pm", "Saturday (Oct 24) at 8:30PM EDT")
+        self.assertParses("sat 21:00", "Saturday (Oct 24) at 9PM EDT")
+        self.assertParses("9pm", "Friday (Oct 23) at 9PM EDT")
+        self.assertParses("@ 9pm", "Friday (Oct 23) at 9PM EDT")
+        self.assertParses("Sat. at 7:30pm pst", "Saturday (Oct 24) at 7:30PM PDT")
+
+    def test_at_is_not_a_weekday(self):
+        self.assertParses("at 9pm", "Friday (Oct 23) at 9PM EDT")
+        self.assertParses("AT 9:30 pm", "Friday (Oct 23) at 9:30PM EDT")
+        self.assertParses("fri at 9pm", "Friday (Oct 23) at 9PM EDT")
+
+    def test_unknown_words(self):
+        for text, message in (("atlantis 9pm", "Unrecognized day"), ("t 9pm", "Unrecognized day"),
+                              ("fri 9pm xyz", "Unknown time zone"), ("25:00", "Unrecognized time")):
+            with self.assertRaisesRegex(ValueError, message):
+                parse_time(text, self.friday)
+
+    def test_dump_round_trip(self):
+        value = parse_time("sat 7pm pst", self.friday)
+        self.assertEqual(parse_time(dump_time(value)), value)
+        self.assertEqual(parse_time(dump_time(value)).tzname(), value.tzname())
+
+
+if __name__ == "__main__":
+    unittest.main()
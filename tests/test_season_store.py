@@ -0,0 +1,110 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from season_store import SeasonStore  # noqa: E402
+
+
+def match(team1, team2, winner=None):
+    return {"team1": team1, "team2": team2, "games": [{"map": ":flag_kr: __Busan__", "winner": winner or team1}]}
+
+
+class SeasonStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'season_results.jsonl')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def pairs(self, store, week):
+        return [(entry["team1"], entry["team2"]) for entry in store.week_results(week)]
+
+    def test_same_week_replaces_results(self):
+        store = SeasonStore(self.path)
+        store.append_week(1, [match("A", "B")])
+        store.append_week(1, [match("A", "C")])
+
+        self.assertEqual(self.pairs(store, 1), [("A", "C")])
+        self.assertEqual(store.team_results("B"), [])
+        self.assertEqual(self.pairs(SeasonStore(self.path), 1), [("A", "C")])
+
+    def test_stale_writer_replaces_week(self):
+        stale = SeasonStore(self.path)
+        writer = SeasonStore(self.path)
+        writer.append_week(1, [match("A", "B")])
+        writer.close()
+
+        # stale never saw the first append, its regenerated week must still replace it
+        stale.append_week(1, [match("A", "C")])
+
+        self.assertEqual(self.pairs(stale, 1), [("A", "C")])
+        self.assertEqual(self.pairs(SeasonStore(self.path), 1), [("A", "C")])
+        self.assertEqual(SeasonStore(self.path).team_results("B"), [])
+
+    def test_stale_writer_keeps_other_weeks(self):
+        stale = SeasonStore(self.path)
+        SeasonStore(self.path).append_week(1, [match("A", "B")])
+        stale.append_week(2, [match("A", "C")])
+
+        self.assertEqual(self.pairs(stale, 1), [("A", "B")])
+        self.assertEqual(self.pairs(stale, 2), [("A", "C")])
+
+    def test_torn_write_is_truncated(self):
+        store = SeasonStore(self.path)
+        store.append_week(1, [match("A", "B"), match("C", "D")])
+        store.close()
+        size = os.path.getsize(self.path)
+
+        # crash halfway through the next append: begin record plus half an entry
+        line = json.dumps(match("A", "C")).encode('utf-8')
+        with open(self.path, 'ab') as file:
+            file.write(b'{"begin": 2}\n' + line[:len(line) // 2])
+
+        store = SeasonStore(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.pairs(store, 1), [("A", "B"), ("C", "D")])
+
+        store.append_week(2, [match("A", "C")])
+        self.assertEqual(self.pairs(SeasonStore(self.path), 2), [("A", "C")])
+
+    def test_incomplete_append_is_dropped(self):
+        SeasonStore(self.path).append_week(1, [match("A", "B")])
+        size = os.path.getsize(self.path)
+
+        # every line is whole, but only one of the two promised entries made it
+        with open(self.path, 'ab') as file:
+            file.write(b'{"begin": 2}\n' + json.dumps({"week": 1, "batch": size, **match("A", "C")}).encode('utf-8') + b"\n")
+
+        store = SeasonStore(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.pairs(store, 1), [("A", "B")])
+
+    def test_corrupt_line_is_truncated(self):
+        SeasonStore(self.path).append_week(1, [match("A", "B")])
+        size = os.path.getsize(self.path)
+        with open(self.path, 'ab') as file:
+            file.write(b"\x00\x00garbage\n")
+
+        store = SeasonStore(self.path)
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.pairs(store, 1), [("A", "B")])
+
+    def test_unsaved_index_catches_up(self):
+        store = SeasonStore(self.path)
+        store.append_week(1, [match("A", "B")])
+        store.append_week(2, [match("C", "D")])
+
+        # no close(), the next load indexes what the saved index is missing
+        store = SeasonStore(self.path)
+        self.assertEqual(self.pairs(store, 1), [("A", "B")])
+        self.assertEqual(self.pairs(store, 2), [("C", "D")])
+        self.assertEqual(len(store.map_results("Busan")), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import socket
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from webhook import PublishError, WebhookPublisher  # noqa: E402
+from webhook_stub import StubWebhookServer  # noqa: E402
+
+# timer slack for loop.time() comparisons
+SLACK = 0.01
+
+
+class WebhookPublisherTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = StubWebhookServer()
+        await self.server.start()
+        self.publisher = WebhookPublisher(retries=3, backoff=0.01)
+
+    async def asyncTearDown(self):
+        self.publisher.close()
+        await self.server.stop()
+
+    def url(self, channel):
+        return f"{self.server.url}{self.path(channel)}"
+
+    def path(self, channel):
+        return f"/api/webhooks/{channel}/token"
+
+    def statuses(self, path):
+        return [status for _, logged_path, status in self.server.log if logged_path == path]
+
+    async def test_channels_keep_their_order(self):
+        jobs = {self.url(channel): [f"{channel} message {i}" for i in range(20)] for channel in range(5)}
+        outcomes = await self.publisher.publish_all(jobs)
+
+        self.assertEqual(outcomes, dict.fromkeys(jobs))
+        for channel in range(5):
+            self.assertEqual(self.server.received[self.path(channel)], jobs[self.url(channel)])
+
+    async def test_server_errors_are_retried(self):
+        self.server.fail(self.path(1), 500, 502)
+        await self.publisher.post(self.url(1), "hello")
+
+        self.assertEqual(self.statuses(self.path(1)), [500, 502, 204])
+        self.assertEqual(self.server.received[self.path(1)], ["hello"])
+        self.assertEqual(self.publisher.sent, 1)
+
+    async def test_server_errors_give_up_after_retries(self):
+        self.server.fail(self.path(1), *[500] * 4)
+        with self.assertRaises(PublishError) as raised:
+            await self.publisher.post(self.url(1), "hello")
+
+        self.assertEqual(raised.exception.status, 500)
+        self.assertEqual(len(self.statuses(self.path(1))), 4)
+        self.assertNotIn(self.path(1), self.server.received)
+
+    async def test_client_errors_are_not_retried(self):
+        self.server.fail(self.path(1), 400)
+        with self.assertRaises(PublishError) as raised:
+            await self.publisher.post(self.url(1), "hello")
+
+        self.assertEqual(raised.exception.status, 400)
+        self.assertEqual(self.statuses(self.path(1)), [400])
+
+    async def test_failed_message_stops_its_channel_only(self):
+        self.server.fail(self.path(1), 404)
+        outcomes = await self.publisher.publish_all({self.url(1): ["a", "b"], self.url(2): ["c", "d"]})
+
+        self.assertIsInstance(outcomes[self.url(1)], PublishError)
+        self.assertIsNone(outcomes[self.url(2)])
+        self.assertNotIn(self.path(1), self.server.received)
+        self.assertEqual(self.server.received[self.path(2)], ["c", "d"])
+
+    async def test_rate_limit_waits_retry_after(self):
+        self.server.fail(self.path(1), 429, retry_after=0.2)
+        await self.publisher.post(self.url(1), "hello")
+
+        (limited_at, _, limited), (sent_at, _, sent) = self.server.log
+        self.assertEqual((limited, sent), (429, 204))
+        self.assertGreaterEqual(sent_at - limited_at, 0.2 - SLACK)
+        self.assertEqual(self.server.received[self.path(1)], ["hello"])
+
+    async def test_channel_rate_limit_leaves_other_channels_alone(self):
+        self.server.fail(self.path(1), 429, retry_after=0.5)
+        await self.publisher.publish_all({self.url(1): ["a"], self.url(2): ["b"]})
+
+        limited_at = next(time for time, path, status in self.server.log if status == 429)
+        other_at = next(time for time, path, status in self.server.log if path == self.path(2))
+        self.assertLess(other_at - limited_at, 0.5)
+        self.assertEqual(self.publisher.global_resume_at, 0.0)
+
+    async def test_global_rate_limit_holds_every_channel(self):
+        self.server.fail(self.path(1), 429, retry_after=0.2, global_limit=True)
+        first = asyncio.create_task(self.publisher.post(self.url(1), "a"))
+
+        # wait for the publisher to read the 429 before posting elsewhere
+        while not self.publisher.global_resume_at:
+            await asyncio.sleep(0.001)
+        await self.publisher.post(self.url(2), "b")
+        await first
+
+        limited_at = self.server.log[0][0]
+        other_at = next(time for time, path, status in self.server.log if path == self.path(2))
+        self.assertGreaterEqual(other_at - limited_at, 0.2 - SLACK)
+        self.assertEqual(self.server.received[self.path(1)], ["a"])
+        self.assertEqual(self.server.received[self.path(2)], ["b"])
+
+    async def test_bucket_headers_avoid_429s(self):
+        self.server.bucket_size = 2
+        self.server.reset_after = 0.1
+        messages = [f"message {i}" for i in range(5)]
+        await self.publisher.publish(self.url(1), messages)
+
+        self.assertEqual(self.server.received[self.path(1)], messages)
+        self.assertEqual(self.server.rate_limited, 0)
+
+        # five messages through a bucket of two wait out two resets
+        times = [time for time, _, _ in self.server.log]
+        self.assertGreaterEqual(times[-1] - times[0], 0.2 - SLACK)
+
+    async def test_connection_refused(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with self.assertRaises(PublishError) as raised:
+            await self.publisher.post(f"http://127.0.0.1:{port}/api/webhooks/1/token", "hello")
+
+        self.assertIsNone(raised.exception.status)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,31 @@
-import json
+import os
+from catalog import build_maps, build_teams, load_cached, maps_by_mode
 
 def load_teams(file_path='teams.json'):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return sorted(json.load(file))
+    return list(load_cached(file_path, build_teams))
 
 def load_maps(file_path='maps.json'):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        maps = json.load(file)
-    sorted_maps = {}
-    for game_mode, map_list in maps.items():
-        sorted_maps[game_mode] = sorted(map_list, key=lambda x: x.split("__")[1].split("__")[0].strip())
-    return sorted_maps
+    return maps_by_mode(load_cached(file_path, build_maps))
+
+def write_atomic(path, data):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+    fsync_dir(path)
+
+def fsync_dir(path):
+
+    # make the rename itself durable, not supported on windows
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,158 @@
+from tkinter import ttk
+
+ROW_PADDING = 5
+
+
+class VirtualList:
+    def __init__(self, canvas, parent, create_row, bind_row, height_key=lambda item: 0, estimate=150, overscan=2):
+        self.canvas = canvas
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.height_key = height_key
+        self.estimate = estimate
+        self.overscan = overscan
+
+        # rows are placed inside a frame sized to the whole list
+        self.body = ttk.Frame(parent, height=1)
+        self.body.pack(fill="x")
+
+        self.items = []
+        self.heights = {}
+        self.visible = {}
+        self.pool = []
+
+        # row sizes plus a fenwick tree of them, so offsets and resizes are O(log n)
+        self.sizes = []
+        self.tree = [0]
+        self.total = 0
+
+    def set_items(self, items):
+        for index in list(self.visible):
+            self.release(index)
+        self.items = items
+        self.relayout()
+
+    def row_for(self, index):
+        return self.visible.get(index)
+
+    def item_height(self, item):
+        return self.heights.get(self.height_key(item), self.estimate)
+
+    def relayout(self):
+
+        # visible rows may have grown into a size we have not measured yet
+        for index, row in self.visible.items():
+            self.measure(index, row)
+
+        self.sizes = [self.item_height(item) for item in self.items]
+        tree = [0] + self.sizes
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.total = sum(self.sizes)
+        self.body.configure(height=max(self.total, 1))
+
+        for index, row in self.visible.items():
+            self.place(index, row)
+        self.refresh()
+
+    def resize(self, index):
+        row = self.visible.get(index)
+        if row and self.measure(index, row):
+            self.relayout()
+            return
+
+        delta = self.item_height(self.items[index]) - self.sizes[index]
+        if not delta:
+            return
+        self.sizes[index] += delta
+        self.total += delta
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+        self.body.configure(height=max(self.total, 1))
+
+        # only rows at or below the resized one move
+        for visible_index, visible_row in self.visible.items():
+            if visible_index >= index:
+                self.place(visible_index, visible_row)
+        self.refresh()
+
+    def offset(self, index):
+        total = 0
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def index_at(self, y):
+
+        # walk the tree down to the last row starting at or above y
+        index = 0
+        step = 1 << (len(self.sizes).bit_length() - 1) if self.sizes else 0
+        while step:
+            next_index = index + step
+            if next_index < len(self.tree) and self.tree[next_index] <= y:
+                index = next_index
+                y -= self.tree[next_index]
+            step >>= 1
+        return min(index, len(self.sizes) - 1)
+
+    def viewport(self):
+        canvas = self.canvas
+        top = canvas.canvasy(0)
+        bottom = canvas.canvasy(canvas.winfo_height())
+
+        # position of the list inside the scrolled canvas
+        body_y = self.body.winfo_rooty() - canvas.winfo_rooty() + top
+        return top - body_y, bottom - body_y
+
+    def refresh(self):
+        if not self.items:
+            return
+
+        top, bottom = self.viewport()
+        first = max(self.index_at(top) - self.overscan, 0)
+        last = min(self.index_at(bottom) + 1 + self.overscan, len(self.items))
+
+        # recycle rows that scrolled out of view
+        for index in [index for index in self.visible if index < first or index >= last]:
+            self.release(index)
+
+        measured = False
+        for index in range(first, last):
+            if index in self.visible:
+                continue
+            row = self.pool.pop() if self.pool else self.create_row(self.body)
+            self.bind_row(row, self.items[index])
+            self.visible[index] = row
+            self.place(index, row)
+            measured |= self.measure(index, row)
+
+        if measured:
+            self.relayout()
+
+    def measure(self, index, row):
+        key = self.height_key(self.items[index])
+        if key in self.heights:
+            return False
+        row["frame"].update_idletasks()
+        self.heights[key] = row["frame"].winfo_reqheight() + 2 * ROW_PADDING
+
+        # placed rows do not propagate their size, so widen the list ourselves
+        width = row["frame"].winfo_reqwidth() + 2 * ROW_PADDING
+        if width > self.body.winfo_reqwidth():
+            self.body.configure(width=width)
+        return True
+
+    def place(self, index, row):
+        height = self.sizes[index] - 2 * ROW_PADDING
+        row["frame"].place(x=ROW_PADDING, y=self.offset(index) + ROW_PADDING, relwidth=1, width=-2 * ROW_PADDING, height=height)
+
+    def release(self, index):
+        row = self.visible.pop(index)
+        row["frame"].place_forget()
+        self.pool.append(row)
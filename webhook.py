@@ -0,0 +1,261 @@
+import argparse
+import asyncio
+import json
+import ssl
+import sys
+from urllib.parse import urlsplit
+from cli import read_weeks
+from announcement import AnnouncementError, MESSAGE_LIMIT, announcement_sections, pack_messages
+from models import Week
+
+MAX_CONNECTIONS_PER_HOST = 8
+RETRIES = 5
+BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+
+
+class PublishError(Exception):
+    def __init__(self, url, status, message):
+        super().__init__(f"{status}: {message}")
+        self.url = url
+        self.status = status
+        self.message = message
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, method, host, target, body, headers):
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host}", f"Content-Length: {len(body)}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+
+        response_headers = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            response_body = await self.read_chunked()
+        else:
+            response_body = await self.reader.readexactly(int(response_headers.get("content-length", 0)))
+        return status, response_headers, response_body
+
+    async def read_chunked(self):
+        chunks = []
+        while True:
+            size = int((await self.reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await self.reader.readline()
+                return b"".join(chunks)
+            chunks.append(await self.reader.readexactly(size))
+            await self.reader.readline()
+
+    def close(self):
+        self.writer.close()
+
+
+class ConnectionPool:
+    def __init__(self, limit_per_host=MAX_CONNECTIONS_PER_HOST, ssl_context=None):
+        self.limit_per_host = limit_per_host
+        self.ssl_context = ssl_context
+        self.idle = {}
+        self.slots = {}
+
+    async def acquire(self, scheme, host, port):
+        key = (scheme, host, port)
+        slots = self.slots.get(key)
+        if slots is None:
+            slots = self.slots[key] = asyncio.Semaphore(self.limit_per_host)
+        await slots.acquire()
+
+        # reuse a keep-alive connection before opening a new one
+        idle = self.idle.setdefault(key, [])
+        while idle:
+            connection = idle.pop()
+            if not connection.writer.is_closing():
+                return connection
+        try:
+            if scheme == "https":
+                context = self.ssl_context or ssl.create_default_context()
+                reader, writer = await asyncio.open_connection(host, port, ssl=context)
+            else:
+                reader, writer = await asyncio.open_connection(host, port)
+        except BaseException:
+            slots.release()
+            raise
+        return Connection(reader, writer)
+
+    def release(self, scheme, host, port, connection, reusable):
+        key = (scheme, host, port)
+        if reusable:
+            self.idle.setdefault(key, []).append(connection)
+        else:
+            connection.close()
+        self.slots[key].release()
+
+    def close(self):
+        for connections in self.idle.values():
+            for connection in connections:
+                connection.close()
+        self.idle.clear()
+
+
+class WebhookPublisher:
+    def __init__(self, pool=None, retries=RETRIES, backoff=BACKOFF, max_backoff=MAX_BACKOFF):
+        self.pool = pool or ConnectionPool()
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        # url -> loop time when that webhook may be used again
+        self.resume_at = {}
+        self.global_resume_at = 0.0
+        self.sent = 0
+
+    async def wait_for_rate_limit(self, url):
+        loop = asyncio.get_running_loop()
+        delay = max(self.resume_at.get(url, 0.0), self.global_resume_at) - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def note_rate_limit(self, url, headers):
+        loop = asyncio.get_running_loop()
+
+        # bucket exhausted, hold this webhook until the bucket resets
+        if headers.get("x-ratelimit-remaining") == "0":
+            reset_after = float(headers.get("x-ratelimit-reset-after", 0) or 0)
+            self.resume_at[url] = loop.time() + reset_after
+
+    async def post(self, url, content):
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        host = parts.hostname
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        body = json.dumps({"content": content}).encode('utf-8')
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+        attempt = 0
+        while True:
+            await self.wait_for_rate_limit(url)
+            connection = None
+            reusable = False
+            try:
+                connection = await self.pool.acquire(scheme, host, port)
+                status, response_headers, response_body = await connection.request("POST", parts.netloc, target, body, headers)
+                reusable = response_headers.get("connection", "").lower() != "close"
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+                status, response_headers, response_body = None, {}, str(e).encode('utf-8')
+            finally:
+                if connection is not None:
+                    self.pool.release(scheme, host, port, connection, reusable)
+
+            if status is not None and 200 <= status < 300:
+                self.note_rate_limit(url, response_headers)
+                self.sent += 1
+                return status
+
+            attempt += 1
+            if attempt > self.retries:
+                raise PublishError(url, status, response_body.decode('utf-8', 'replace'))
+
+            if status == 429:
+
+                # discord sends retry_after in the body and the header, the body is more precise
+                retry_after = float(response_headers.get("retry-after", 1) or 1)
+                try:
+                    retry_after = float(json.loads(response_body).get("retry_after", retry_after))
+                except (ValueError, AttributeError):
+                    pass
+                resume_at = asyncio.get_running_loop().time() + retry_after
+                if response_headers.get("x-ratelimit-global", "").lower() == "true":
+                    self.global_resume_at = resume_at
+                else:
+                    self.resume_at[url] = resume_at
+                continue
+
+            # other client errors will not succeed on retry
+            if status is not None and 400 <= status < 500:
+                raise PublishError(url, status, response_body.decode('utf-8', 'replace'))
+
+            await asyncio.sleep(min(self.backoff * 2 ** (attempt - 1), self.max_backoff))
+
+    async def publish(self, url, messages):
+
+        # one channel posts strictly in order, a failure stops the rest of its messages
+        for message in messages:
+            await self.post(url, message)
+
+    async def publish_all(self, jobs):
+
+        # channels run concurrently, returns url -> exception or None
+        urls = list(jobs)
+        outcomes = await asyncio.gather(*(self.publish(url, jobs[url]) for url in urls), return_exceptions=True)
+        return dict(zip(urls, outcomes))
+
+    def close(self):
+        self.pool.close()
+
+
+def build_jobs(weeks, webhooks, limit=MESSAGE_LIMIT):
+
+    # webhooks: division -> url, weeks without a division use "default"
+    jobs = {}
+    for week in weeks:
+        division = week.get("division") or "default"
+        url = webhooks.get(division)
+        if url is None:
+            raise KeyError(f"No webhook configured for division {division!r}.")
+        sections, _ = announcement_sections(Week.from_dict(week))
+        jobs.setdefault(url, []).extend(pack_messages(sections, limit))
+    return jobs
+
+
+async def publish_jobs(jobs):
+    publisher = WebhookPublisher()
+    try:
+        return await publisher.publish_all(jobs)
+    finally:
+        publisher.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Post UTOW announcements to division webhooks.")
+    parser.add_argument("week_file", help="JSON/JSONL week file with a \"division\" per week")
+    parser.add_argument("--webhooks", default="webhooks.json", help="JSON file mapping division to webhook URL")
+    parser.add_argument("--message-limit", type=int, default=MESSAGE_LIMIT)
+    args = parser.parse_args(argv)
+
+    with open(args.webhooks, 'r', encoding='utf-8') as file:
+        webhooks = json.load(file)
+    fmt = "jsonl" if args.week_file.endswith(".jsonl") else "json"
+    with open(args.week_file, 'r', encoding='utf-8') as file:
+        try:
+            jobs = build_jobs(read_weeks(file, fmt), webhooks, args.message_limit)
+        except (AnnouncementError, KeyError) as e:
+            print(e.message if isinstance(e, AnnouncementError) else e.args[0], file=sys.stderr)
+            return 1
+
+    outcomes = asyncio.run(publish_jobs(jobs))
+    failed = 0
+    for url, outcome in outcomes.items():
+        if outcome is not None:
+            print(f"{url}: {outcome}", file=sys.stderr)
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+
+class StubWebhookServer:
+    def __init__(self, host="127.0.0.1", port=0, bucket_size=5, reset_after=0.0, latency=0.0):
+        self.host = host
+        self.port = port
+
+        # per-path rate limit bucket, reset_after=0 disables limiting
+        self.bucket_size = bucket_size
+        self.reset_after = reset_after
+        self.latency = latency
+        self.buckets = {}
+        self.received = {}
+        self.rate_limited = 0
+
+        # path -> scripted failures answered before anything else, see fail()
+        self.failures = {}
+
+        # (loop time, path, status) for every request, retries included
+        self.log = []
+        self.server = None
+        self.handlers = set()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self.server.close()
+
+        # hang up on keep-alive clients so their handlers finish before the loop does
+        for writer in list(self.handlers):
+            writer.close()
+        while self.handlers:
+            await asyncio.sleep(0)
+        await self.server.wait_closed()
+
+    def fail(self, path, *statuses, retry_after=0.05, global_limit=False):
+
+        # the next requests to path get these statuses, 429s carry retry_after like discord's
+        self.failures.setdefault(path, []).extend((status, retry_after, global_limit) for status in statuses)
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def handle(self, reader, writer):
+
+        # keep-alive: serve requests on this connection until the client hangs up
+        self.handlers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                path = request_line.split()[1].decode('latin-1')
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                status, response_headers, response_body = self.respond(path, body)
+                self.log.append((asyncio.get_running_loop().time(), path, status))
+
+                lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+                response_headers["Content-Length"] = len(response_body)
+                lines.extend(f"{name}: {value}" for name, value in response_headers.items())
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1') + response_body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.handlers.discard(writer)
+            writer.close()
+
+    def respond(self, path, body):
+        loop = asyncio.get_running_loop()
+        if self.failures.get(path):
+            return self.scripted(*self.failures[path].pop(0))
+        if not self.reset_after:
+            self.received.setdefault(path, []).append(json.loads(body)["content"])
+            return 204, {}, b""
+
+        remaining, reset_at = self.buckets.get(path, (self.bucket_size, 0.0))
+        now = loop.time()
+        if now >= reset_at:
+            remaining, reset_at = self.bucket_size, now + self.reset_after
+
+        if remaining == 0:
+            self.rate_limited += 1
+            retry_after = reset_at - now
+            response_body = json.dumps({"message": "You are being rate limited.", "retry_after": retry_after}).encode('utf-8')
+            headers = {"Content-Type": "application/json", "Retry-After": f"{retry_after:.3f}", "X-RateLimit-Remaining": 0}
+            return 429, headers, response_body
+
+        remaining -= 1
+        self.buckets[path] = (remaining, reset_at)
+        self.received.setdefault(path, []).append(json.loads(body)["content"])
+        headers = {
+            "X-RateLimit-Limit": self.bucket_size,
+            "X-RateLimit-Remaining": remaining,
+            "X-RateLimit-Reset-After": f"{reset_at - now:.3f}"
+        }
+        return 204, headers, b""
+
+    def scripted(self, status, retry_after, global_limit):
+        if status != 429:
+            return status, {"Content-Type": "application/json"}, json.dumps({"message": HTTPStatus(status).phrase}).encode('utf-8')
+
+        self.rate_limited += 1
+        body = {"message": "You are being rate limited.", "retry_after": retry_after, "global": global_limit}
+        headers = {"Content-Type": "application/json", "Retry-After": f"{retry_after:.3f}"}
+        if global_limit:
+            headers["X-RateLimit-Global"] = "true"
+        return 429, headers, json.dumps(body).encode('utf-8')